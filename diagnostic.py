@@ -8,21 +8,26 @@ print("=" * 70)
 print("\n1. Current Working Directory:")
 print(f"   {os.getcwd()}")
 
+# One scandir per directory instead of a stat syscall per check
+root_entries = {e.name for e in os.scandir(".")}
+src_entries = {e.name for e in os.scandir("src")} if "src" in root_entries else set()
+mod_entries = {e.name for e in os.scandir("src/modules")} if "modules" in src_entries else set()
+
 print("\n2. Project Root Check:")
-if os.path.exists("src") and os.path.exists("tests"):
+if "src" in root_entries and "tests" in root_entries:
     print("   ✓ Correct: tests/ is at root level")
-elif os.path.exists("src/tests"):
+elif "tests" in src_entries:
     print("   ✗ WRONG: tests/ is inside src/")
     print("   Fix: mv src/tests ./tests")
 else:
     print("   ? Tests folder not found")
 
 print("\n3. __init__.py Files:")
-print(f"   src/__init__.py exists: {os.path.exists('src/__init__.py')}")
-print(f"   src/modules/__init__.py exists: {os.path.exists('src/modules/__init__.py')}")
+print(f"   src/__init__.py exists: {'__init__.py' in src_entries}")
+print(f"   src/modules/__init__.py exists: {'__init__.py' in mod_entries}")
 
 print("\n4. Resume Parser File:")
-print(f"   src/modules/resume_parser.py exists: {os.path.exists('src/modules/resume_parser.py')}")
+print(f"   src/modules/resume_parser.py exists: {'resume_parser.py' in mod_entries}")
 
 print("\n5. Python Path:")
 for i, path in enumerate(sys.path[:5]):
@@ -86,6 +86,11 @@ def parse_args() -> argparse.Namespace:
         action  = "store_true",
         help    = "Run pipeline only — no interactive UI",
     )
+    p.add_argument(
+        "--no-db-tune",
+        action  = "store_true",
+        help    = "Skip SQLite PRAGMA tuning (WAL, relaxed fsync) on startup",
+    )
     p.add_argument(
         "--results",
         type    = int,
@@ -106,14 +111,27 @@ def parse_args() -> argparse.Namespace:
 # MAIN
 # ------------------------------------------------------------------
 
+def print_stats(store) -> None:
+    """Print database stats for headless runs."""
+    stats = store.get_stats()
+    print(f"\nDatabase stats:")
+    print(f"  Total jobs:    {stats['total']}")
+    print(f"  Not applied:   {stats['not_applied']}")
+    print(f"  Applied:       {stats['applied']}")
+    print(f"  Interviewing:  {stats['interviewing']}")
+    print(f"  Offers:        {stats['offer_received']}")
+    print(f"  Best score:    {stats['best_score']:.3f}")
+
+
 def main() -> int:
     args = parse_args()
 
     # -- Import here so CLI --help is instant (no heavy imports) ---
+    # PipelineRunner (selenium, spaCy, transformers) and TrackerApp
+    # (textual) are imported lazily below, only on the paths that
+    # actually use them.
     from src.modules.pipeline_config  import PipelineConfig
-    from src.modules.pipeline_runner  import PipelineRunner
     from src.modules.job_store        import JobStore
-    from src.modules.tracker_ui       import TrackerApp
 
     # -- Build config ----------------------------------------------
     config_kwargs = dict(
@@ -121,6 +139,7 @@ def main() -> int:
         resume_path     = args.resume,
         min_score       = args.min_score,
         db_path         = args.db,
+        db_tune         = not args.no_db_tune,
         results_wanted  = args.results,
         job_sites       = args.sites,
     )
@@ -140,7 +159,16 @@ def main() -> int:
     print(f"  Database: {args.db}")
     print(f"{'='*60}\n")
 
-    # -- Build runner (keeps store open) ---------------------------
+    # -- Fast path: stats only, no pipeline stack needed -----------
+    if args.no_search and args.headless:
+        store = JobStore(config.db_path, tune=config.db_tune)
+        print_stats(store)
+        store.close()
+        return 0
+
+    # -- Build runner (keeps store open; tunes SQLite per config) --
+    from src.modules.pipeline_runner import PipelineRunner
+
     runner = PipelineRunner(config)
 
     # -- Stage 1: run pipeline (unless --no-search) ----------------
@@ -157,18 +185,13 @@ def main() -> int:
 
     # -- Stage 2: open tracker (unless --headless) -----------------
     if args.headless:
-        stats = runner.store.get_stats()
-        print(f"\nDatabase stats:")
-        print(f"  Total jobs:    {stats['total']}")
-        print(f"  Not applied:   {stats['not_applied']}")
-        print(f"  Applied:       {stats['applied']}")
-        print(f"  Interviewing:  {stats['interviewing']}")
-        print(f"  Offers:        {stats['offer_received']}")
-        print(f"  Best score:    {stats['best_score']:.3f}")
+        print_stats(runner.store)
         runner.close()
         return 0
 
     # -- Launch TrackerApp -----------------------------------------
+    from src.modules.tracker_ui import TrackerApp
+
     def run_search_from_ui():
         """Called when user presses [s] inside the tracker."""
         return runner.run()
@@ -4,385 +4,684 @@ Education Extraction Module
 Extracts education information (degree, field, institution) from resume text.
 """
 
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional, List, Tuple
 import re
 
+import pandas as pd
 import spacy
+from spacy.matcher import Matcher
+
+# Degree normalization — frozen; branch tags always map to one of these
+_DEGREE_NORM = MappingProxyType({
+    'bachelor': 'Bachelor',
+    'master': 'Master',
+    'phd': 'PhD',
+})
+
+# Field-of-study abbreviation expansion (post-title-case keys)
+_FIELD_ABBREV = MappingProxyType({
+    'Cs': 'Computer Science',
+    'Ce': 'Computer Engineering',
+    'Ee': 'Electrical Engineering',
+    'Ece': 'Electrical And Computer Engineering',
+    'Me': 'Mechanical Engineering',
+    'Che': 'Chemical Engineering',
+    'It': 'Information Technology',
+    'Is': 'Information Systems',
+    'Ai': 'Artificial Intelligence',
+    'Ml': 'Machine Learning',
+    'Ds': 'Data Science',
+    'Mis': 'Management Information Systems'
+})
+
+# All compiled regexes and constant tables, built once per process and
+# shared across EducationExtractor instances (see _compiled_tables)
+_CompiledTables = namedtuple('_CompiledTables', [
+    'combined_re',           # fused degree alternation (IGNORECASE)
+    'combined_lc_re',        # case-sensitive variant for lowercased text
+    'field_clean_re',        # field-name noise/punctuation stripper
+    'abbrev_re',             # degree abbreviation alternation
+    'abbrev_table',          # normalized abbreviation -> expansion
+    'institution_keywords',  # generic university keywords
+    'known_institutions',    # well-known institution names
+    'kw_re',                 # compiled keyword alternation
+    'known_re',              # compiled known-institution alternation
+    'simple_inst_re',        # "<Name> University/College/..." pattern
+    'from_at_re',            # "from/at <institution>" pattern
+])
+
+
+@lru_cache(maxsize=1)
+def _compiled_tables() -> _CompiledTables:
+    """
+    Build every compiled regex and lookup table the extractor needs.
+
+    Cached so constructing EducationExtractor repeatedly (tests, one
+    instance per resume) pays the compilation cost only once per process.
+    """
+    # Degree abbreviations and full names
+    bachelor_variants = [
+        r"bachelor'?s?\s+of",
+        r"bachelor'?s?",
+        r"b\.?\s?s\.?c?\.?",
+        r"b\.?\s?a\.?",
+        r"b\.?\s?tech\.?",
+        r"b\.?\s?e\.?"
+    ]
+
+    master_variants = [
+        r"master'?s?\s+of",
+        r"master'?s?",
+        r"m\.?\s?s\.?c?\.?",
+        r"m\.?\s?a\.?",
+        r"m\.?\s?b\.?\s?a\.?",
+        r"m\.?\s?eng\.?",
+        r"m\.?\s?tech\.?",
+        r"m\.?\s?e\.?"
+    ]
+
+    phd_variants = [
+        r"ph\.?\s?d\.?",
+        r"doctorate",
+        r"doctoral",
+        r"d\.?\s?phil\.?"
+    ]
+
+    # Tag each pattern with its degree type; tags double as regex
+    # group names, so PhD branches go first to win at equal positions.
+    tagged_patterns = []
+
+    for degree_type, variants in [
+        ('phd', phd_variants),      # Check PhD first
+        ('master', master_variants), # Then Master
+        ('bachelor', bachelor_variants) # Then Bachelor
+    ]:
+        # Pattern 1: "Bachelor of Science in Computer Science"
+        pattern1 = (
+            r'\b(' + '|'.join(variants) + r')\s+'
+            r'(?:of\s+)?(?:science|arts|engineering|business|technology)?\s+'
+            r'(?:in\s+)?'
+            r'([A-Z][a-zA-Z\s&-]+?)'
+            r'(?:\s+(?:from|at|,|\(|\n|$))'
+        )
+        tagged_patterns.append((f'{degree_type}_p1', pattern1))
+
+        # Pattern 2: "MS in Computer Science" or "PhD in AI"
+        pattern2 = (
+            r'\b(' + '|'.join(variants) + r')\s+'
+            r'in\s+'
+            r'([A-Z][a-zA-Z\s&-]+?)'
+            r'(?:\s+(?:from|at|,|\(|\n|$))'
+        )
+        tagged_patterns.append((f'{degree_type}_p2', pattern2))
+
+        # Pattern 3: "MS Computer Science" (no "in")
+        pattern3 = (
+            r'\b(' + '|'.join(variants) + r')\s+'
+            r'([A-Z][a-zA-Z\s&]+)'
+            r'(?:,|\s+(?:from|at|\(|\n|$))'
+        )
+        tagged_patterns.append((f'{degree_type}_p3', pattern3))
+
+    # Compile once: a single alternation means one linear pass over the
+    # text instead of one scan per pattern. Each branch is wrapped in a
+    # zero-width lookahead so matches never consume text — without it a
+    # greedy lower-priority match (bachelor pattern 3 spans newlines)
+    # can swallow a later PhD/Master mention and demote the result.
+    combined_source = '|'.join(
+        f'(?=(?P<{tag}>{pattern}))' for tag, pattern in tagged_patterns
+    )
+    combined_re = re.compile(combined_source, re.IGNORECASE | re.MULTILINE)
+
+    # Case-sensitive variant run against pre-lowercased text: avoids
+    # per-character case folding in the regex engine. [A-Z] becomes
+    # [a-z], which is equivalent since IGNORECASE already let the
+    # anchor match any letter (see _iter_degree_matches).
+    combined_lc_re = re.compile(
+        combined_source.replace('[A-Z]', '[a-z]'), re.MULTILINE
+    )
+
+    # One anchored alternation covers leading noise, trailing noise
+    # and trailing punctuation for field-name cleanup
+    field_clean_re = re.compile(
+        r'^(?:of|in|the)\s+|\s+(?:from|at|the|and|or)$|[,;.()]+$',
+        re.IGNORECASE
+    )
+
+    # Abbreviation expansion: keys are the matched token with
+    # dots/whitespace stripped, uppercased
+    abbrev_table = MappingProxyType({
+        'BSCS': 'Bachelor of Science in Computer Science',
+        'MSCS': 'Master of Science in Computer Science',
+        'BSEE': 'Bachelor of Science in Electrical Engineering',
+        'MSEE': 'Master of Science in Electrical Engineering',
+        'PHDIN': 'PhD in ',
+        'MSIN': 'MS in ',
+        'BSIN': 'BS in ',
+    })
+
+    abbrev_re = re.compile(
+        r'\bBS\s+CS\b|\bMS\s+CS\b|\bBS\s+EE\b|\bMS\s+EE\b'
+        r'|\bPh\.D\.\s+in\s+|\bM\.S\.\s+in\s+|\bB\.S\.\s+in\s+',
+        re.IGNORECASE
+    )
+
+    # Common university keywords
+    institution_keywords = (
+        "university", "college", "institute", "school",
+        "polytechnic", "academy"
+    )
+
+    # Well-known institutions (can be expanded)
+    known_institutions = frozenset({
+        "mit", "stanford", "harvard", "berkeley", "caltech",
+        "cmu", "carnegie mellon", "georgia tech", "ut austin",
+        "oxford", "cambridge", "imperial college",
+        "iit", "nit", "bits", "iiit", "nau", "northern arizona"
+    })
+
+    # Compiled alternations: one C-level scan per lookup instead of
+    # one Python substring search per dictionary entry
+    kw_re = re.compile('|'.join(map(re.escape, institution_keywords)))
+    known_re = re.compile('|'.join(map(re.escape, known_institutions)))
+
+    # Institution name patterns, compiled once
+    simple_inst_re = re.compile(
+        r'([A-Z][a-zA-Z\s]+(?:University|College|Institute|School|Academy))'
+    )
+    from_at_re = re.compile(
+        r'(?:from|at)\s+([A-Z][a-zA-Z\s]+(?:University|College|Institute|School|Academy))'
+    )
+
+    return _CompiledTables(
+        combined_re=combined_re,
+        combined_lc_re=combined_lc_re,
+        field_clean_re=field_clean_re,
+        abbrev_re=abbrev_re,
+        abbrev_table=abbrev_table,
+        institution_keywords=institution_keywords,
+        known_institutions=known_institutions,
+        kw_re=kw_re,
+        known_re=known_re,
+        simple_inst_re=simple_inst_re,
+        from_at_re=from_at_re,
+    )
 
 
 class EducationExtractor:
     """
     Extract education information from resume text.
-    
+
     Extracts:
     - Degree type (Bachelor's, Master's, PhD, etc.)
     - Field of study (Computer Science, Engineering, etc.)
     - Institution (University name)
-    
+
     Usage:
         extractor = EducationExtractor()
         education = extractor.extract_education(text)
     """
-    
+
+    # Generic/noise words never accepted as a field of study
+    _NOISE_WORDS = frozenset({
+        'of', 'in', 'from', 'at', 'the', 'and', 'or',
+        'university', 'college', 'institute', 'school'
+    })
+
+    # Higher degrees win when multiple match
+    _PRIORITY = {'phd': 3, 'master': 2, 'bachelor': 1}
+
     def __init__(self, use_nlp: bool = True):
         """
         Initialize the education extractor.
-        
+
         Args:
             use_nlp: If True, use spaCy for institution detection.
         """
         self.use_nlp = use_nlp
         self._nlp = None
-        
+
         if self.use_nlp:
             self._load_spacy_model()
-        
-        # Build degree patterns
-        self._build_degree_patterns()
-        
-        # Build known institutions list
-        self._build_known_institutions()
-    
+
+        # Bind the process-wide compiled pattern tables
+        self._bind_compiled_tables()
+
+        # Token-level degree matcher (needs the spaCy vocab)
+        if self.use_nlp:
+            self._build_degree_matcher()
+
+    def _bind_compiled_tables(self):
+        """
+        Bind the shared, lazily-compiled pattern tables to this instance.
+
+        All regexes and constant tables live in a module-level cache so
+        repeated construction skips recompilation entirely.
+        """
+        tables = _compiled_tables()
+
+        self._combined_re = tables.combined_re
+        self._combined_lc_re = tables.combined_lc_re
+        self._field_clean_re = tables.field_clean_re
+        self._abbrev_re = tables.abbrev_re
+        self._abbrev_table = tables.abbrev_table
+        self.institution_keywords = tables.institution_keywords
+        self.known_institutions = tables.known_institutions
+        self._kw_re = tables.kw_re
+        self._known_re = tables.known_re
+        self._simple_inst_re = tables.simple_inst_re
+        self._from_at_re = tables.from_at_re
+
+        # Degree normalization (shared frozen mapping)
+        self.degree_normalization = _DEGREE_NORM
+
     def _load_spacy_model(self):
-        """Load spaCy model lazily."""
+        """Load spaCy model lazily (shared process-wide singleton)."""
         if self._nlp is not None:
             return
-        
-        try:
-            self._nlp = spacy.load("en_core_web_sm")
-        except OSError as e:
-            raise RuntimeError(
-                "spaCy model 'en_core_web_sm' not found. "
-                "Run: python -m spacy download en_core_web_sm"
-            ) from e
-
-    def _build_degree_patterns(self):
-        """
-        Build regex patterns for degree detection.
-        
-        Patterns capture:
-        - Degree type
-        - Optional field of study
-        """
-        # Degree abbreviations and full names
-        bachelor_variants = [
-            r"bachelor'?s?\s+of",
-            r"bachelor'?s?",
-            r"b\.?\s?s\.?c?\.?",
-            r"b\.?\s?a\.?",
-            r"b\.?\s?tech\.?",
-            r"b\.?\s?e\.?"
-        ]
-        
-        master_variants = [
-            r"master'?s?\s+of",
-            r"master'?s?",
-            r"m\.?\s?s\.?c?\.?",
-            r"m\.?\s?a\.?",
-            r"m\.?\s?b\.?\s?a\.?",
-            r"m\.?\s?eng\.?",
-            r"m\.?\s?tech\.?",
-            r"m\.?\s?e\.?"
-        ]
-        
-        phd_variants = [
-            r"ph\.?\s?d\.?",
-            r"doctorate",
-            r"doctoral",
-            r"d\.?\s?phil\.?"
-        ]
-        
-        # Create patterns
-        self.degree_patterns = []
-        
-        for degree_type, variants in [
-            ('phd', phd_variants),      # Check PhD first
-            ('master', master_variants), # Then Master
-            ('bachelor', bachelor_variants) # Then Bachelor
-        ]:
-            # Pattern 1: "Bachelor of Science in Computer Science"
-            pattern1 = (
-                r'\b(' + '|'.join(variants) + r')\s+'
-                r'(?:of\s+)?(?:science|arts|engineering|business|technology)?\s+'
-                r'(?:in\s+)?'
-                r'([A-Z][a-zA-Z\s&-]+?)'
-                r'(?:\s+(?:from|at|,|\(|\n|$))'
-            )
-            self.degree_patterns.append((degree_type, pattern1))
-            
-            # Pattern 2: "MS in Computer Science" or "PhD in AI"
-            pattern2 = (
-                r'\b(' + '|'.join(variants) + r')\s+'
-                r'in\s+'
-                r'([A-Z][a-zA-Z\s&-]+?)'
-                r'(?:\s+(?:from|at|,|\(|\n|$))'
-            )
-            self.degree_patterns.append((degree_type, pattern2))
-            
-            # Pattern 3: "MS Computer Science" (no "in")
-            pattern3 = (
-                r'\b(' + '|'.join(variants) + r')\s+'
-                r'([A-Z][a-zA-Z\s&]+)'
-                r'(?:,|\s+(?:from|at|\(|\n|$))'
-            )
-            self.degree_patterns.append((degree_type, pattern3))
-        
-        # Degree normalization
-        self.degree_normalization = {
-            'bachelor': 'Bachelor',
-            'master': 'Master',
-            'phd': 'PhD'
-        }
-
-    def _build_known_institutions(self):
-        """
-        Build list of known universities and keywords.
-        
-        Used to identify institutions even without full name.
-        """
-        # Common university keywords
-        self.institution_keywords = [
-            "university", "college", "institute", "school",
-            "polytechnic", "academy"
-        ]
-        
-        # Well-known institutions (can be expanded)
-        self.known_institutions = {
-            "mit", "stanford", "harvard", "berkeley", "caltech",
-            "cmu", "carnegie mellon", "georgia tech", "ut austin",
-            "oxford", "cambridge", "imperial college",
-            "iit", "nit", "bits", "iiit", "nau", "northern arizona"
-        }
+
+        # Same NER-only pipeline the job history extractor uses —
+        # loaded once per process and shared between them
+        from src.modules.job_history_extractor import _get_spacy_model
+        self._nlp = _get_spacy_model()
+
+    def _build_degree_matcher(self):
+        """
+        Build a token-level spaCy Matcher for degree keywords.
+
+        Runs one pass over a Doc that is already tokenized for NER, so
+        it costs nothing extra to consult when the regex patterns find
+        no degree. Rules are attribute-only (LOWER) because the tagger
+        is disabled in the loaded pipeline.
+        """
+        self._degree_matcher = Matcher(self._nlp.vocab)
+
+        # Conservative keyword lists: fallback detection only, so
+        # ambiguous short forms (ma, me, be) are left out
+        self._degree_matcher.add('phd', [
+            [{'LOWER': {'IN': ['phd', 'ph.d', 'ph.d.', 'doctorate',
+                               'doctoral', 'd.phil', 'd.phil.']}}],
+        ])
+        self._degree_matcher.add('master', [
+            [{'LOWER': {'IN': ['master', 'masters', 'ms', 'm.s', 'm.s.',
+                               'msc', 'm.sc.', 'mba', 'm.b.a.',
+                               'm.eng', 'm.tech']}}],
+        ])
+        self._degree_matcher.add('bachelor', [
+            [{'LOWER': {'IN': ['bachelor', 'bachelors', 'bs', 'b.s', 'b.s.',
+                               'bsc', 'b.sc.', 'b.tech', 'btech']}}],
+        ])
+
+    def _degree_from_doc(self, doc) -> Optional[Tuple[str, str]]:
+        """
+        Detect the highest-priority degree type from an existing Doc.
+
+        Used as a fallback when the regex patterns cannot parse a
+        degree + field pair; returns (degree, "") with no field.
+        """
+        best_type = None
+        best_priority = -1
+
+        for match_id, _, _ in self._degree_matcher(doc):
+            degree_type = self._nlp.vocab.strings[match_id]
+            priority = self._PRIORITY.get(degree_type, 0)
+            if priority > best_priority:
+                best_type = degree_type
+                best_priority = priority
+
+        if best_type is None:
+            return None
+
+        return (_DEGREE_NORM[best_type], "")
 
     def _expand_abbreviations(self, text: str) -> str:
         """
         Expand common abbreviations before pattern matching.
-        
+
         This helps patterns catch abbreviated formats.
         """
-        # Common degree abbreviations with context
-        replacements = [
-            (r'\bBS\s+CS\b', 'Bachelor of Science in Computer Science'),
-            (r'\bMS\s+CS\b', 'Master of Science in Computer Science'),
-            (r'\bBS\s+EE\b', 'Bachelor of Science in Electrical Engineering'),
-            (r'\bMS\s+EE\b', 'Master of Science in Electrical Engineering'),
-            (r'\bPh\.D\.\s+in\s+', 'PhD in '),
-            (r'\bM\.S\.\s+in\s+', 'MS in '),
-            (r'\bB\.S\.\s+in\s+', 'BS in '),
-        ]
-        
-        expanded = text
-        for pattern, replacement in replacements:
-            expanded = re.sub(pattern, replacement, expanded, flags=re.IGNORECASE)
-        
-        return expanded
+        def replace(match):
+            key = ''.join(match.group(0).replace('.', '').upper().split())
+            return self._abbrev_table[key]
+
+        return self._abbrev_re.sub(replace, text)
 
     def extract_education(self, text: str) -> str:
         """
         Extract education information from resume text.
-        
+
         Returns formatted string: "[Degree] in [Field] | [Institution]"
-        
+
         Args:
             text: Resume text
-            
+
         Returns:
             Formatted education string, or empty string if not found
         """
         if not text or not text.strip():
             return ""
-        
+
         # Expand abbreviations first
         expanded_text = self._expand_abbreviations(text)
-        
+
         # Step 1: Extract degree and field
         degree_info = self._extract_degree_and_field(expanded_text)
-        
+
+        # Fallback: token-level matcher on the Doc already built for NER
+        if degree_info is None and self.use_nlp:
+            degree_info = self._degree_from_doc(self._window_doc(text))
+
         # Step 2: Extract institution (use original text)
         institution = self._extract_institution(text)
-        
+
         # Step 3: Format result
         if degree_info or institution:
             return self._format_education(degree_info, institution)
-        
+
         return ""
 
+    def extract_education_batch(self, texts: List[str]) -> List[str]:
+        """
+        Extract education information from many resumes at once.
+
+        Batches the spaCy pipeline via nlp.pipe so tokenizer and NER
+        cost is amortized across documents instead of paid per call.
+
+        Args:
+            texts: List of resume texts
+
+        Returns:
+            List of formatted education strings, aligned with texts
+        """
+        if not self.use_nlp:
+            return [self.extract_education(text) for text in texts]
+
+        results = []
+        windows = [self._institution_window(text) for text in texts]
+        docs = list(self._nlp.pipe(windows, batch_size=64))
+
+        # One vectorized keyword scan over all ORG entities in the batch
+        org_candidates = self._filter_org_ents_batch(docs)
+
+        for text, doc, candidates in zip(texts, docs, org_candidates):
+            if not text or not text.strip():
+                results.append("")
+                continue
+
+            expanded_text = self._expand_abbreviations(text)
+            degree_info = self._extract_degree_and_field(expanded_text)
+            if degree_info is None:
+                degree_info = self._degree_from_doc(doc)
+            institution = self._select_institution(candidates, text)
+
+            if degree_info or institution:
+                results.append(self._format_education(degree_info, institution))
+            else:
+                results.append("")
+
+        return results
+
+    def _iter_degree_matches(self, text: str):
+        """
+        Yield (degree_type, field_raw) for each degree match in text.
+
+        Matching runs over a lowercased copy against the case-sensitive
+        pattern, which is cheaper than re.IGNORECASE case folding inside
+        the engine and exactly equivalent (the [A-Z] anchor already
+        matched any letter under IGNORECASE). Capture spans are sliced
+        from the original text so field casing is preserved. Falls back
+        to the case-insensitive pattern when lowercasing changes the
+        string length (rare non-ASCII case folds would misalign spans).
+
+        The fused branches are zero-width lookaheads, so matches can
+        overlap: every degree mention is yielded even when an earlier
+        greedy match spans the same text.
+        """
+        group_index = self._combined_re.groupindex
+
+        text_lc = text.lower()
+        if len(text_lc) == len(text):
+            matches = self._combined_lc_re.finditer(text_lc)
+        else:
+            matches = self._combined_re.finditer(text)
+
+        for match in matches:
+            # The branch tag encodes degree type + pattern index;
+            # its field capture sits two groups after the branch group.
+            tag = match.lastgroup
+            group = group_index[tag] + 2
+            field_raw = text[match.start(group):match.end(group)]
+
+            yield tag.rsplit('_', 1)[0], field_raw
+
     def _extract_degree_and_field(self, text: str) -> Optional[Tuple[str, str]]:
         """
         Extract degree type and field of study.
-        
+
         Args:
             text: Resume text
-            
+
         Returns:
             Tuple of (degree_type, field) or None
         """
         best_match = None
         best_priority = -1
-        
-        priority_map = {'phd': 3, 'master': 2, 'bachelor': 1}
-        
-        for degree_type, pattern in self.degree_patterns:
-            try:
-                matches = re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE)
-                
-                for match in matches:
-                    if len(match.groups()) < 2:
-                        continue
-                    
-                    degree_raw = match.group(1).strip()
-                    field_raw = match.group(2).strip() if match.group(2) else ""
-                    
-                    # Clean field name
-                    field = self._clean_field_name(field_raw)
-                    
-                    # Skip if field is too short or generic
-                    if len(field) < 2:
-                        continue
-                    
-                    # Skip generic/noise words
-                    noise_words = {
-                        'of', 'in', 'from', 'at', 'the', 'and', 'or',
-                        'university', 'college', 'institute', 'school'
-                    }
-                    if field.lower() in noise_words:
-                        continue
-                    
-                    # Normalize degree
-                    degree = self.degree_normalization.get(degree_type, degree_type.title())
-                    
-                    # Check if this is a better match (higher priority)
-                    current_priority = priority_map.get(degree_type, 0)
-                    if current_priority > best_priority:
-                        best_match = (degree, field)
-                        best_priority = current_priority
-            
-            except Exception as e:
-                # Continue if pattern fails
+
+        for degree_type, field_raw in self._iter_degree_matches(text):
+            # Clean field name
+            field = self._clean_field_name(field_raw.strip())
+
+            # Skip if field is too short or generic
+            if len(field) < 2:
+                continue
+
+            # Skip generic/noise words
+            if field.lower() in self._NOISE_WORDS:
                 continue
-        
+
+            # Normalize degree — degree_type is always a known key
+            degree = _DEGREE_NORM[degree_type]
+
+            # Check if this is a better match (higher priority)
+            current_priority = self._PRIORITY.get(degree_type, 0)
+            if current_priority > best_priority:
+                best_match = (degree, field)
+                best_priority = current_priority
+
+                # PhD is the highest priority; no later match can beat it
+                if best_priority == 3:
+                    return best_match
+
         return best_match
-    
+
     def _clean_field_name(self, field: str) -> str:
         """
         Clean and standardize field of study name.
-        
+
         Args:
             field: Raw field name
-            
+
         Returns:
             Cleaned field name
         """
         if not field:
             return ""
-        
+
         # Remove extra whitespace
-        field = re.sub(r'\s+', ' ', field).strip()
-        
-        # Remove trailing punctuation
-        field = re.sub(r'[,;.()]+$', '', field).strip()
-        
-        # Remove trailing noise words
-        field = re.sub(r'\s+(from|at|the|and|or)$', '', field, flags=re.IGNORECASE).strip()
-        
-        # Remove leading noise
-        field = re.sub(r'^(of|in|the)\s+', '', field, flags=re.IGNORECASE).strip()
-        
+        field = ' '.join(field.split())
+
+        # Strip leading/trailing noise words and trailing punctuation in
+        # one pass; loop because removing punctuation can expose a
+        # trailing noise word (usually converges in one iteration)
+        while True:
+            cleaned = self._field_clean_re.sub('', field).strip()
+            if cleaned == field:
+                break
+            field = cleaned
+
         # Limit length (max 50 chars)
         if len(field) > 50:
             field = field[:50].rsplit(' ', 1)[0]
-        
+
         # Title case
         field = field.title()
-        
-        # Common abbreviation expansion
-        abbrev_map = {
-            'Cs': 'Computer Science',
-            'Ce': 'Computer Engineering',
-            'Ee': 'Electrical Engineering',
-            'Ece': 'Electrical And Computer Engineering',
-            'Me': 'Mechanical Engineering',
-            'Che': 'Chemical Engineering',
-            'It': 'Information Technology',
-            'Is': 'Information Systems',
-            'Ai': 'Artificial Intelligence',
-            'Ml': 'Machine Learning',
-            'Ds': 'Data Science',
-            'Mis': 'Management Information Systems'
-        }
-        
+
         # Check exact match
-        if field in abbrev_map:
-            return abbrev_map[field]
-        
+        if field in _FIELD_ABBREV:
+            return _FIELD_ABBREV[field]
+
         # Check if field ends with abbreviation
         words = field.split()
-        if words and words[-1] in abbrev_map:
-            words[-1] = abbrev_map[words[-1]]
+        if words and words[-1] in _FIELD_ABBREV:
+            words[-1] = _FIELD_ABBREV[words[-1]]
             field = ' '.join(words)
-        
+
         return field
 
     def _extract_institution(self, text: str) -> Optional[str]:
         """
         Extract institution name from text.
-        
+
         Uses spaCy NER and keyword matching.
-        
+
         Args:
             text: Resume text
-            
+
         Returns:
             Institution name or None
         """
         if not self.use_nlp:
             return self._extract_institution_simple(text)
-        
-        # Use spaCy to find organizations
-        doc = self._nlp(text)
-        
+
+        # Strategy 1: ORG entities with university keywords (NER is the
+        # expensive step, so it's memoized per text)
+        return self._select_institution(self._ner_org_candidates(text), text)
+
+    def _select_institution(
+        self,
+        candidates: Tuple[str, ...],
+        text: str
+    ) -> Optional[str]:
+        """Pick an institution from NER candidates plus regex fallback."""
+        # NER candidates win; only the first candidate is ever returned
+        if candidates:
+            return candidates[0]
+
+        # Strategy 2: Explicit pattern matching
+        # "from [institution]", "at [institution]" — first match only,
+        # so search() avoids scanning past it
+        match = self._from_at_re.search(text)
+        if match:
+            return match.group(1)
+
+        return None
+
+    def _institution_window(self, text: str) -> str:
+        """
+        Slice the text down to lines likely to mention an institution.
+
+        NER cost scales with token count, but institutions almost always
+        sit on lines containing a university keyword or known name, so
+        only those lines (plus one line of context) are fed to spaCy.
+        Falls back to the full text when no keyword line is found.
+        """
+        lines = text.splitlines()
+        if len(lines) <= 3:
+            return text
+
+        keep = set()
+        for i, line in enumerate(lines):
+            line_lower = line.lower()
+            if self._kw_re.search(line_lower) or self._known_re.search(line_lower):
+                keep.update(j for j in (i - 1, i, i + 1) if 0 <= j < len(lines))
+
+        if not keep:
+            return text
+
+        return '\n'.join(lines[j] for j in sorted(keep))
+
+    @lru_cache(maxsize=8)
+    def _window_doc(self, text: str):
+        """
+        Tokenize the institution window of a text through the pipeline.
+
+        Memoized so NER and the degree matcher share one Doc per text
+        instead of each paying the neural pipeline cost, and only
+        keyword-bearing lines go through the pipeline.
+        """
+        return self._nlp(self._institution_window(text))
+
+    def _ner_org_candidates(self, text: str) -> Tuple[str, ...]:
+        """Run spaCy NER and return ORG entities that look like institutions."""
+        return self._filter_org_ents(self._window_doc(text))
+
+    def _filter_org_ents(self, doc) -> Tuple[str, ...]:
+        """Keep ORG entities that match institution keywords or known names."""
         candidates = []
-        
-        # Strategy 1: ORG entities with university keywords
+
         for ent in doc.ents:
             if ent.label_ == "ORG":
                 org_text = ent.text.strip()
                 org_lower = org_text.lower()
-                
+
                 # Check if contains university keywords
-                has_keyword = any(keyword in org_lower for keyword in self.institution_keywords)
-                
+                has_keyword = bool(self._kw_re.search(org_lower))
+
                 # Check against known institutions
-                is_known = any(known in org_lower for known in self.known_institutions)
-                
+                is_known = bool(self._known_re.search(org_lower))
+
                 if has_keyword or is_known:
                     candidates.append(org_text)
-        
-        # Strategy 2: Explicit pattern matching
-        # "from [institution]", "at [institution]"
-        pattern = r'(?:from|at)\s+([A-Z][a-zA-Z\s]+(?:University|College|Institute|School|Academy))'
-        matches = re.findall(pattern, text)
-        candidates.extend(matches)
-        
-        # Return first valid candidate
-        if candidates:
-            return candidates[0]
-        
-        return None
-    
+
+        return tuple(candidates)
+
+    def _filter_org_ents_batch(self, docs) -> List[Tuple[str, ...]]:
+        """
+        Vectorized ORG-entity filtering across a batch of Docs.
+
+        Gathers every ORG entity in the batch into one pandas Series and
+        applies the compiled keyword/known-institution patterns with two
+        C-level str.contains passes, instead of a Python regex call per
+        entity per document. Results are scattered back per document.
+        """
+        doc_index = []
+        org_texts = []
+
+        for i, doc in enumerate(docs):
+            for ent in doc.ents:
+                if ent.label_ == "ORG":
+                    doc_index.append(i)
+                    org_texts.append(ent.text.strip())
+
+        candidates = [[] for _ in docs]
+
+        if org_texts:
+            lowered = pd.Series(org_texts).str.lower()
+            keep = (
+                lowered.str.contains(self._kw_re.pattern, regex=True)
+                | lowered.str.contains(self._known_re.pattern, regex=True)
+            )
+            for i, org_text, kept in zip(doc_index, org_texts, keep.to_numpy()):
+                if kept:
+                    candidates[i].append(org_text)
+
+        return [tuple(c) for c in candidates]
+
     def _extract_institution_simple(self, text: str) -> Optional[str]:
         """
         Simple institution extraction without NLP.
-        
+
         Uses regex patterns only.
         """
-        # Pattern: University/College name
-        pattern = r'([A-Z][a-zA-Z\s]+(?:University|College|Institute|School|Academy))'
-        matches = re.findall(pattern, text)
-        
-        if matches:
-            return matches[0].strip()
-        
+        # Pattern: University/College name — stop at the first match
+        match = self._simple_inst_re.search(text)
+
+        if match:
+            return match.group(1).strip()
+
         return None
 
     def _format_education(
@@ -392,75 +691,62 @@ class EducationExtractor:
     ) -> str:
         """
         Format education information into standard string.
-        
+
         Format: "[Degree] in [Field] | [Institution]"
-        
+
         Args:
             degree_info: Tuple of (degree, field) or None
             institution: Institution name or None
-            
+
         Returns:
             Formatted string
         """
         parts = []
-        
+
         if degree_info:
             degree, field = degree_info
             if field:
                 parts.append(f"{degree} in {field}")
             else:
                 parts.append(degree)
-        
+
         if institution:
             parts.append(institution)
-        
+
         return " | ".join(parts) if parts else ""
 
     def extract_all_degrees(self, text: str) -> List[str]:
         """
         Extract all degrees mentioned in text (not just highest).
-        
+
         Useful for debugging and analysis.
-        
+
         Args:
             text: Resume text
-            
+
         Returns:
             List of all degree strings found
         """
         expanded_text = self._expand_abbreviations(text)
-        degrees = []
-        
-        for degree_type, pattern in self.degree_patterns:
-            try:
-                matches = re.finditer(pattern, expanded_text, re.IGNORECASE | re.MULTILINE)
-                
-                for match in matches:
-                    if len(match.groups()) < 2:
-                        continue
-                    
-                    degree_raw = match.group(1).strip()
-                    field_raw = match.group(2).strip() if match.group(2) else ""
-                    
-                    field = self._clean_field_name(field_raw)
-                    
-                    # Skip noise
-                    if len(field) < 2:
-                        continue
-                    
-                    noise_words = {'of', 'in', 'from', 'at', 'the', 'university', 'college'}
-                    if field.lower() in noise_words:
-                        continue
-                    
-                    degree = self.degree_normalization.get(degree_type, degree_type.title())
-                    
-                    degree_str = f"{degree} in {field}" if field else degree
-                    
-                    # Avoid duplicates
-                    if degree_str not in degrees:
-                        degrees.append(degree_str)
-            
-            except Exception:
+
+        # Ordered dict keys give O(1) dedup while preserving text order
+        seen = {}
+
+        for degree_type, field_raw in self._iter_degree_matches(expanded_text):
+            field = self._clean_field_name(field_raw.strip())
+
+            # Skip noise
+            if len(field) < 2:
                 continue
-        
-        return degrees
+
+            if field.lower() in self._NOISE_WORDS:
+                continue
+
+            degree = _DEGREE_NORM[degree_type]
+
+            degree_str = f"{degree} in {field}" if field else degree
+
+            # Avoid duplicates
+            seen.setdefault(degree_str, None)
+
+        return list(seen)
@@ -7,10 +7,56 @@ Maps education text → ordinal level → normalized score.
 """
 
 import logging
+import re
+from functools import lru_cache
 from typing import List, Tuple
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Ordinal education levels — each tuple: (level, regex fragment).
+# Word boundaries replace the old space-padding hacks (" ms ", "bs "),
+# so "MS" is recognized at the start or end of a string too, and
+# "master" can't fire inside "mastermind".
+EDUCATION_LEVELS: List[Tuple[int, str]] = [
+    (5, r"ph\.?d|doctorate|doctoral"),
+    (4, r"masters?|m\.?sc|m\.s|ms|mba|m\.?eng|m\.?tech"),
+    (3, r"bachelors?|b\.?sc|b\.s|bs|b\.?eng|b\.?tech|undergraduate|college\s+degree"),
+    (2, r"associate|a\.s|a\.a"),
+    (1, r"high\s+school|secondary|ged|hsc"),
+]
+
+# All level fragments fused into one alternation: a single linear
+# scan of the text replaces ~25 Python substring checks. Group
+# names encode the level ("l5" → 5).
+_LEVEL_RE = re.compile('|'.join(
+    rf"(?P<l{level}>\b(?:{fragment})\b)"
+    for level, fragment in EDUCATION_LEVELS
+), re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _detect_level_cached(text: str) -> int:
+    """
+    Scan an education string and return its level (0-5).
+
+    Matching is case-insensitive in the pattern itself, so no lowered
+    copy of the text is allocated. Cached because requirement strings
+    repeat across every candidate scored in a batch, and candidate
+    strings recur too.
+    """
+    # One pass over the text; keep the highest level seen and stop
+    # early once PhD (the maximum) is found
+    best = 0
+    for match in _LEVEL_RE.finditer(text):
+        level = int(match.lastgroup[1:])
+        if level > best:
+            best = level
+            if best == 5:
+                break
+    return best
+
 
 class EducationScorer:
     """
@@ -35,16 +81,9 @@ class EducationScorer:
         print(score)   # 1.0 (Master > Bachelor)
     """
 
-    # Ordinal education levels — checked highest first
-    # Each tuple: (level, [keywords])
-    EDUCATION_LEVELS: List[Tuple[int, List[str]]] = [
-        (5, ["phd", "ph.d", "doctorate", "doctoral"]),
-        (4, ["master", "msc", "m.s.", "m.s ", " ms ", "mba", "m.eng", "m.tech"]),
-        (3, ["bachelor", "bsc", "b.s.", "b.s ", "bs ", "b.eng", "b.tech",
-             "undergraduate", "college degree"]),
-        (2, ["associate", "a.s.", "a.a."]),          # ← plain "associate" added
-        (1, ["high school", "secondary school", "ged", "hsc", "secondary"]),
-    ]
+    # Shared with the module-level detection function; kept on the
+    # class so callers can still introspect the level table here
+    EDUCATION_LEVELS = EDUCATION_LEVELS
 
     # Penalty per level below requirement
     PENALTY_PER_LEVEL: float = 0.20
@@ -87,10 +126,25 @@ class EducationScorer:
             >>> scorer.score("Master in CS", "")
             1.0   # no requirement
         """
-        # Detect levels
-        required_level  = self._detect_level(required_education)
-        candidate_level = self._detect_level(candidate_education)
+        return self._score_from_levels(
+            self._detect_level(candidate_education),
+            self._detect_level(required_education),
+        )
+
+    def _score_from_levels(self, candidate_level: int, required_level: int) -> float:
+        """
+        Apply the scoring rules to already-detected levels.
+
+        Shared by score() and score_with_details() so each input is
+        only level-detected once per call.
 
+        Args:
+            candidate_level: Detected candidate level 0-5
+            required_level:  Detected required level 0-5
+
+        Returns:
+            Float score 0.0 → 1.0
+        """
         # Special case: no requirement
         if required_level == 0:
             logger.debug("No education requirement → score = 1.0")
@@ -98,18 +152,20 @@ class EducationScorer:
 
         # Special case: unknown candidate education
         if candidate_level == 0:
+            # %-style args keep message formatting lazy — no string is
+            # built unless DEBUG is actually enabled
             logger.debug(
-                f"Unknown candidate education "
-                f"(required level={required_level}) "
-                f"→ partial credit {self.UNKNOWN_SCORE}"
+                "Unknown candidate education (required level=%d) "
+                "→ partial credit %s",
+                required_level, self.UNKNOWN_SCORE,
             )
             return self.UNKNOWN_SCORE
 
         # Candidate meets or exceeds requirement
         if candidate_level >= required_level:
             logger.debug(
-                f"Candidate level {candidate_level} >= "
-                f"required level {required_level} → score = 1.0"
+                "Candidate level %d >= required level %d → score = 1.0",
+                candidate_level, required_level,
             )
             return 1.0
 
@@ -119,13 +175,52 @@ class EducationScorer:
         score = max(0.0, round(score, 4))   # floor at 0.0, NOT UNKNOWN_SCORE
 
         logger.debug(
-            f"Education gap: {gap} levels "
-            f"(required={required_level}, candidate={candidate_level}) "
-            f"→ score={score:.4f}"
+            "Education gap: %d levels (required=%d, candidate=%d) → score=%.4f",
+            gap, required_level, candidate_level, score,
         )
 
         return score
 
+    def score_batch(
+        self,
+        candidate_educations: List[str],
+        required_education: str,
+    ) -> np.ndarray:
+        """
+        Score many candidates against one job requirement.
+
+        Detects the required level once, maps each candidate string to
+        its level, then computes every score in one vectorized
+        expression — no per-row Python branching.
+
+        Args:
+            candidate_educations: Education strings, one per candidate
+            required_education:   Education requirement from JobProfile
+
+        Returns:
+            Float array of scores 0.0 → 1.0, one per candidate
+        """
+        n = len(candidate_educations)
+        required_level = self._detect_level(required_education)
+
+        if required_level == 0:
+            return np.ones(n)
+
+        cand_levels = np.fromiter(
+            (self._detect_level(text) for text in candidate_educations),
+            dtype=np.int8,
+            count=n,
+        )
+
+        gap_scores = np.maximum(
+            0.0, 1.0 - (required_level - cand_levels) * self.PENALTY_PER_LEVEL
+        )
+        return np.where(
+            cand_levels == 0,
+            self.UNKNOWN_SCORE,
+            np.where(cand_levels >= required_level, 1.0, gap_scores.round(4)),
+        )
+
     def score_with_details(
         self,
         candidate_education: str,
@@ -147,7 +242,7 @@ class EducationScorer:
         required_level  = self._detect_level(required_education)
         candidate_level = self._detect_level(candidate_education)
         gap             = max(0, required_level - candidate_level)
-        final_score     = self.score(candidate_education, required_education)
+        final_score     = self._score_from_levels(candidate_level, required_level)
         meets           = candidate_level >= required_level and required_level > 0
 
         return {
@@ -192,20 +287,9 @@ class EducationScorer:
         if not text or not text.strip():
             return 0
 
-        text_lower = text.lower()
-
-        # Scan highest to lowest — return on first match
-        for level, keywords in self.EDUCATION_LEVELS:
-            for keyword in keywords:
-                if keyword in text_lower:
-                    logger.debug(
-                        f"Detected level {level} "
-                        f"(keyword='{keyword}') in '{text[:40]}'"
-                    )
-                    return level
-
-        logger.debug(f"No education level detected in '{text[:40]}'")
-        return 0
+        # No per-call logging here — this runs once per string per
+        # batch and the messages added nothing over score()'s own
+        return _detect_level_cached(text)
 
     def _level_label(self, level: int) -> str:
         """
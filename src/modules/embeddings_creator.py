@@ -6,10 +6,13 @@ for semantic similarity matching.
 """
 
 from typing import List, Dict, Optional
+import hashlib
+import os
+import sqlite3
+
 import numpy as np
 
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 
 
 class EmbeddingsCreator:
@@ -30,29 +33,140 @@ class EmbeddingsCreator:
     # Model name (class-level constant)
     DEFAULT_MODEL = "all-MiniLM-L6-v2"
     EMBEDDING_DIM = 384
+
+    # Encode batch size — 64 is the CPU sweet spot for MiniLM;
+    # override via environment for GPU boxes (256+)
+    BATCH_SIZE = int(os.environ.get("FT_BOT_EMB_BATCH_SIZE", "64"))
+
+    # Batches larger than this are sharded across a multi-process
+    # worker pool (only started on machines with more than 4 cores)
+    MULTIPROCESS_THRESHOLD = 128
+
+    # All embeddings produced by this class are unit-normalized at
+    # encode time, so cosine similarity reduces to a dot product
+    _normalized = True
+
+    # Shared read-only zero vector returned for empty texts — avoids
+    # allocating a fresh array (or running the model) per empty field
+    _ZERO = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+    _ZERO.setflags(write=False)
     
-    def __init__(self, model_name: Optional[str] = None):
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        cache_path: Optional[str] = None,
+        backend: Optional[str] = None,
+    ):
         """
         Initialize the embeddings creator.
-        
+
         Args:
             model_name: Sentence Transformer model name.
                        Defaults to 'all-MiniLM-L6-v2'.
+            cache_path: Optional path to a SQLite file used as a
+                       persistent embedding cache. Repeated texts
+                       (skill names, unchanged job descriptions) are
+                       then read back in microseconds instead of
+                       re-running the model.
+            backend:   Inference backend — "torch" (default) or
+                       "onnx". ONNX Runtime skips PyTorch eager-mode
+                       overhead on CPU; requires the optional
+                       sentence-transformers[onnx] extras and falls
+                       back to torch if they are missing.
         """
         self.model_name = model_name or self.DEFAULT_MODEL
+        self.backend = backend or os.environ.get("FT_BOT_EMB_BACKEND", "torch")
         self._model = None
-        
+        self._pool = None
+
         # Lazy loading: model loads on first use
         # This avoids slow startup if embeddings aren't needed
-    
+
+        self._cache = None
+        if cache_path:
+            self._cache = sqlite3.connect(cache_path)
+            self._cache.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "  key    TEXT PRIMARY KEY,"
+                "  vector BLOB NOT NULL"
+                ")"
+            )
+            self._cache.commit()
+
+    @staticmethod
+    def _cache_key(text: str) -> str:
+        """Hash a text to a short stable cache key."""
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+    def _cache_get(self, text: str) -> Optional[np.ndarray]:
+        """Return the cached embedding for text, or None on a miss."""
+        if self._cache is None:
+            return None
+        row = self._cache.execute(
+            "SELECT vector FROM embeddings WHERE key = ?",
+            (self._cache_key(text),),
+        ).fetchone()
+        if row is None:
+            return None
+        return np.frombuffer(row[0], dtype=np.float32)
+
+    def _cache_put(self, text: str, embedding: np.ndarray) -> None:
+        """Store an embedding under the text's cache key."""
+        if self._cache is None:
+            return
+        self._cache.execute(
+            "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+            (self._cache_key(text), embedding.astype(np.float32).tobytes()),
+        )
+        self._cache.commit()
+
     def _load_model(self):
         """Load the Sentence Transformer model lazily."""
         if self._model is not None:
             return
         
+        # Resolve the device once instead of per encode call
+        import torch
+        self._device = "cuda" if torch.cuda.is_available() else "cpu"
+
         print(f"Loading embedding model: {self.model_name}...")
-        self._model = SentenceTransformer(self.model_name)
-        print(f"✓ Model loaded (dimension: {self.EMBEDDING_DIM})")
+
+        if self.backend == "onnx":
+            # ONNX Runtime backend: fused graph, no autograd
+            # bookkeeping — typically 2-4× faster CPU inference.
+            # Needs the sentence-transformers[onnx] extras.
+            try:
+                self._model = SentenceTransformer(
+                    self.model_name, device=self._device, backend="onnx"
+                )
+            except (TypeError, ImportError, ValueError) as e:
+                print(f"⚠ ONNX backend unavailable ({e}), falling back to torch")
+                self.backend = "torch"
+
+        if self._model is None:
+            self._model = SentenceTransformer(self.model_name, device=self._device)
+
+        print(f"✓ Model loaded (dimension: {self.EMBEDDING_DIM}, device: {self._device})")
+
+    def _get_pool(self):
+        """
+        Lazily start the multi-process encode pool.
+
+        Only worth it on boxes with more than 4 cores; returns None
+        otherwise so callers fall back to single-process encoding.
+        """
+        if self._pool is None and (os.cpu_count() or 1) > 4:
+            self._pool = self._model.start_multi_process_pool()
+        return self._pool
+
+    def close(self) -> None:
+        """Release the worker pool and cache connection, if open."""
+        if self._pool is not None:
+            SentenceTransformer.stop_multi_process_pool(self._pool)
+            self._pool = None
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
 
     def create_text_embedding(self, text: str) -> np.ndarray:
         """
@@ -70,16 +184,26 @@ class EmbeddingsCreator:
             >>> print(emb.shape)
             (384,)
         """
-        self._load_model()
-        
         if not text or not text.strip():
-            # Return zero vector for empty text
-            return np.zeros(self.EMBEDDING_DIM)
-        
-        # Encode single text
-        embedding = self._model.encode(text, show_progress_bar=False)
-        
-        return embedding.astype(np.float32)
+            # Shared zero vector for empty text — no model needed
+            return self._ZERO
+
+        cached = self._cache_get(text)
+        if cached is not None:
+            return cached
+
+        self._load_model()
+
+        # Encode single text (normalized in the model's own path)
+        embedding = self._model.encode(
+            text,
+            show_progress_bar=False,
+            normalize_embeddings=True
+        )
+
+        embedding = embedding.astype(np.float32)
+        self._cache_put(text, embedding)
+        return embedding
 
     def create_batch_embeddings(self, texts: List[str]) -> np.ndarray:
         """
@@ -97,60 +221,123 @@ class EmbeddingsCreator:
             >>> print(embs.shape)
             (3, 384)
         """
-        self._load_model()
-        
         if not texts:
             return np.zeros((0, self.EMBEDDING_DIM))
-        
-        # Replace empty strings with placeholder
-        cleaned = [t if t and t.strip() else "empty" for t in texts]
-        
-        # Batch encode (much faster than one-by-one)
-        embeddings = self._model.encode(
-            cleaned,
-            show_progress_bar=False,
-            batch_size=32
-        )
-        
-        return embeddings.astype(np.float32)
+
+        result = np.zeros((len(texts), self.EMBEDDING_DIM), dtype=np.float32)
+
+        # Only run the model on non-empty cache misses; empty texts
+        # stay as zero rows and hits come straight from the cache
+        miss_idx = []
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+            cached = self._cache_get(text)
+            if cached is not None:
+                result[i] = cached
+            else:
+                miss_idx.append(i)
+
+        if miss_idx:
+            self._load_model()
+            miss_texts = [texts[i] for i in miss_idx]
+
+            pool = self._get_pool() if len(miss_idx) > self.MULTIPROCESS_THRESHOLD else None
+
+            if pool is not None:
+                # Shard the batch across worker processes — sentence
+                # encoding is embarrassingly parallel across cores
+                embeddings = self._model.encode_multi_process(
+                    miss_texts,
+                    pool,
+                    batch_size=self.BATCH_SIZE,
+                )
+                embeddings = embeddings.astype(np.float32)
+                # Workers may predate normalize_embeddings support, so
+                # enforce the unit-norm invariant here
+                norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+                embeddings /= np.maximum(norms, 1e-12)
+            else:
+                # Batch encode (much faster than one-by-one)
+                embeddings = self._model.encode(
+                    miss_texts,
+                    show_progress_bar=False,
+                    batch_size=self.BATCH_SIZE,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True
+                )
+                embeddings = embeddings.astype(np.float32)
+            result[miss_idx] = embeddings
+            for i, embedding in zip(miss_idx, embeddings):
+                self._cache_put(texts[i], embedding)
+
+        return result
+
+    def create_skills_matrix(self, skills: List[str]) -> "tuple[List[str], np.ndarray]":
+        """
+        Create skill embeddings in structure-of-arrays form.
+
+        Returns the unique normalized skill names alongside one
+        contiguous (N, 384) matrix — the layout downstream similarity
+        wants, since scoring all skills against a query is then a
+        single `matrix @ query` instead of N scattered dot products.
+
+        Skills are normalized (stripped, lowercased) before
+        deduplication so case/whitespace variants share one encoder
+        call and one cache entry.
+
+        Args:
+            skills: List of skill names (e.g., ["python", "tensorflow", "aws"])
+
+        Returns:
+            Tuple of (unique skill names, embeddings matrix (N, 384))
+
+        Example:
+            >>> names, matrix = creator.create_skills_matrix(["python", "aws"])
+            >>> print(matrix.shape)
+            (2, 384)
+        """
+        if not skills:
+            return [], np.zeros((0, self.EMBEDDING_DIM), dtype=np.float32)
+
+        # Normalize then dedupe (order-preserving) — "Python" and
+        # "python " collapse to one encoder invocation
+        unique_skills = list(dict.fromkeys(
+            s.strip().lower() for s in skills if s and s.strip()
+        ))
+
+        embeddings = self.create_batch_embeddings(unique_skills)
+
+        return unique_skills, np.ascontiguousarray(embeddings, dtype=np.float32)
 
     def create_skills_embeddings(self, skills: List[str]) -> Dict[str, np.ndarray]:
         """
         Create embeddings for a list of skills.
-        
-        Returns a dictionary mapping each skill name to its embedding vector.
-        
+
+        Thin dict wrapper over create_skills_matrix for callers that
+        look skills up by name; keys are the normalized skill form.
+        Prefer the matrix form for vectorized similarity.
+
         Args:
             skills: List of skill names (e.g., ["python", "tensorflow", "aws"])
-            
+
         Returns:
             Dictionary: {skill_name: embedding_vector}
-            
+
         Example:
             >>> skills_embs = creator.create_skills_embeddings(["python", "aws"])
             >>> print(skills_embs["python"].shape)
             (384,)
         """
-        if not skills:
-            return {}
-        
-        # Remove duplicates while preserving order
-        unique_skills = list(dict.fromkeys(skills))
-        
-        # Batch encode all skills at once
-        embeddings = self.create_batch_embeddings(unique_skills)
-        
-        # Build dictionary
-        skills_dict = {}
-        for skill, embedding in zip(unique_skills, embeddings):
-            skills_dict[skill] = embedding
-        
-        return skills_dict
+        names, matrix = self.create_skills_matrix(skills)
+        return dict(zip(names, matrix))
 
     def compute_similarity(self, embedding_a: np.ndarray, embedding_b: np.ndarray) -> float:
         """
         Compute cosine similarity between two embeddings.
-        
+
+        Assumes unit-normalized vectors, as produced by this class.
+
         Args:
             embedding_a: First embedding vector (384,)
             embedding_b: Second embedding vector (384,)
@@ -163,14 +350,12 @@ class EmbeddingsCreator:
             >>> print(f"Match: {sim:.2f}")
             0.78
         """
-        # Reshape to 2D for sklearn (expects matrix input)
-        a = embedding_a.reshape(1, -1)
-        b = embedding_b.reshape(1, -1)
-        
-        similarity = cosine_similarity(a, b)[0][0]
-        
+        # Embeddings are unit-normalized at encode time, so cosine
+        # similarity is just the dot product
+        similarity = float(embedding_a @ embedding_b)
+
         # Clamp to [0, 1] range (cosine can technically be -1 to 1)
-        return float(max(0.0, min(1.0, similarity)))
+        return max(0.0, min(1.0, similarity))
     
     def compute_batch_similarity(
         self,
@@ -181,7 +366,8 @@ class EmbeddingsCreator:
         Compute similarity between one embedding and many others.
         
         Useful for comparing one resume against multiple job descriptions.
-        
+        Assumes unit-normalized vectors, as produced by this class.
+
         Args:
             embedding: Single embedding (384,)
             embeddings_list: Multiple embeddings (n, 384)
@@ -196,12 +382,67 @@ class EmbeddingsCreator:
             >>> print(scores)
             [0.72, 0.45, 0.88]
         """
-        query = embedding.reshape(1, -1)
-        
-        similarities = cosine_similarity(query, embeddings_list)[0]
-        
-        # Clamp to [0, 1]
-        return np.clip(similarities, 0.0, 1.0)
+        # One matrix-vector product against the whole batch; rows are
+        # unit-normalized at encode time so no per-row norms are needed
+        similarities = embeddings_list @ embedding
+
+        # Clamp to [0, 1] in place — the product is already a fresh
+        # array, no need to allocate another for the clip
+        np.clip(similarities, 0.0, 1.0, out=similarities)
+        return similarities
+
+    def quantize_embeddings(self, embeddings: np.ndarray) -> np.ndarray:
+        """
+        Quantize FP32 embeddings to int8 for compact storage.
+
+        Unit-normalized components lie in [-1, 1], so they map onto
+        the int8 range by scaling with 127. This cuts storage and
+        memory bandwidth 4× (1536 → 384 bytes per vector) at <1%
+        cosine drift.
+
+        Args:
+            embeddings: FP32 embeddings, shape (384,) or (n, 384)
+
+        Returns:
+            int8 array of the same shape
+
+        Example:
+            >>> q = creator.quantize_embeddings(creator.create_batch_embeddings(texts))
+            >>> q.dtype
+            dtype('int8')
+        """
+        return np.round(np.clip(embeddings, -1.0, 1.0) * 127).astype(np.int8)
+
+    def compute_batch_similarity_int8(
+        self,
+        embedding_q: np.ndarray,
+        embeddings_list_q: np.ndarray
+    ) -> np.ndarray:
+        """
+        Compute similarity between int8-quantized embeddings.
+
+        Works on the output of quantize_embeddings: dot products are
+        accumulated in int32 and rescaled by 127², so the result is
+        comparable to the FP32 cosine scores.
+
+        Args:
+            embedding_q: Single quantized embedding (384,) int8
+            embeddings_list_q: Quantized embeddings (n, 384) int8
+
+        Returns:
+            Array of similarity scores (n,) float
+
+        Example:
+            >>> q_jobs = creator.quantize_embeddings(job_embs)
+            >>> q_resume = creator.quantize_embeddings(resume_emb)
+            >>> scores = creator.compute_batch_similarity_int8(q_resume, q_jobs)
+        """
+        scores = (
+            embeddings_list_q.astype(np.int32) @ embedding_q.astype(np.int32)
+        ) / (127.0 * 127.0)
+
+        np.clip(scores, 0.0, 1.0, out=scores)
+        return scores
 
     def build_resume_summary_text(
         self,
@@ -350,6 +591,10 @@ class EmbeddingsCreator:
         Returns a dictionary with:
           - "job_embedding":    np.ndarray shape (384,)
           - "skills_embeddings": Dict[str, np.ndarray] per-skill vectors
+          - "skills_names":     List[str] unique normalized skill names
+          - "skills_matrix":    np.ndarray (N, 384) contiguous, same
+                                row order as skills_names — use this
+                                for vectorized similarity
           - "summary_text":     str used for embedding (for debugging)
 
         Args:
@@ -371,17 +616,24 @@ class EmbeddingsCreator:
             required_education=required_education,
         )
 
-        # Create job-level embedding from summary
-        job_embedding = self.create_text_embedding(summary_text)
-
-        # Deduplicate and embed all skills (required + nice-to-have)
-        all_skills = list(dict.fromkeys(
-            required_hard_skills + nice_to_have_skills
+        # Normalize and dedupe skills, then encode the summary and
+        # every skill in ONE batch — a single model forward pass over
+        # N+1 inputs instead of one call for the summary plus one for
+        # the skills
+        skills_names = list(dict.fromkeys(
+            s.strip().lower()
+            for s in required_hard_skills + nice_to_have_skills
+            if s and s.strip()
         ))
-        skills_embeddings = self.create_skills_embeddings(all_skills)
+
+        batch = self.create_batch_embeddings([summary_text] + skills_names)
+        job_embedding = batch[0]
+        skills_matrix = np.ascontiguousarray(batch[1:], dtype=np.float32)
 
         return {
             "job_embedding": job_embedding,
-            "skills_embeddings": skills_embeddings,
+            "skills_embeddings": dict(zip(skills_names, skills_matrix)),
+            "skills_names": skills_names,
+            "skills_matrix": skills_matrix,
             "summary_text": summary_text,
         }
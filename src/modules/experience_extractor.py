@@ -7,8 +7,42 @@ Extracts years of work experience from resume text.
 from typing import List, Tuple, Optional
 import re
 from datetime import datetime
-from dateutil import parser as date_parser
-from dateutil.relativedelta import relativedelta
+
+
+def _build_month_lut() -> list:
+    """
+    Build a 32-slot perfect-hash table mapping three-letter month
+    prefixes to month numbers. The hash (c0 + c1 + 3*c2) & 31 over
+    OR-32-lowercased chars is collision-free for the 12 prefixes
+    (verified at build), so a month probe is three ord() calls and a
+    list index — no string slice, no .lower() allocation, no dict hash.
+    """
+    lut = [0] * 32
+    prefixes = ('jan', 'feb', 'mar', 'apr', 'may', 'jun',
+                'jul', 'aug', 'sep', 'oct', 'nov', 'dec')
+    for month, p in enumerate(prefixes, start=1):
+        h = ((ord(p[0]) | 32) + (ord(p[1]) | 32) + 3 * (ord(p[2]) | 32)) & 31
+        assert lut[h] == 0, "month prefix hash collision"
+        lut[h] = month
+    return lut
+
+
+_MONTH_LUT = _build_month_lut()
+
+
+def _month_from_token(token: str) -> int:
+    """
+    Probe the month LUT with the first three characters of ``token``.
+
+    Returns a candidate month number 1-12, or 0 for a definite miss.
+    A non-zero result can be a false positive (any token can hash into
+    an occupied slot), so callers must still confirm the token against
+    the month's full name.
+    """
+    if len(token) < 3:
+        return 0
+    h = ((ord(token[0]) | 32) + (ord(token[1]) | 32) + 3 * (ord(token[2]) | 32)) & 31
+    return _MONTH_LUT[h]
 
 
 class ExperienceExtractor:
@@ -24,7 +58,39 @@ class ExperienceExtractor:
         extractor = ExperienceExtractor()
         years = extractor.extract_years_of_experience(text)
     """
-    
+
+    # All four date-range patterns fused and left-factored into one
+    # pattern: optional month, year, separator, then (optional month +
+    # year | present). Months are [A-Za-z]+ rather than \w+ so the
+    # month branches can never overlap the digit branches — the engine
+    # decides each alternative on the first character instead of
+    # backtracking. Dispatch happens on which named groups matched.
+    _RANGE_RE = re.compile(
+        r'(?:(?P<m1>[A-Za-z]+)\s+)?(?P<y1>\d{4})\s*[-–—]\s*'
+        r'(?:(?:(?P<m2>[A-Za-z]+)\s+)?(?P<y2>\d{4})|(?P<pres>present|current|now))',
+        re.IGNORECASE
+    )
+
+    # Direct-mention patterns, compiled once at class scope so every
+    # call (and every worker process) reuses the same objects
+    _DIRECT_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+        r'(\d+\.?\d*)\+?\s*years?\s+of\s+(?:work\s+)?experience',
+        r'(\d+\.?\d*)\+?\s*years?\s+(?:working|in)',
+        r'over\s+(\d+\.?\d*)\s*years?',
+        r'more\s+than\s+(\d+\.?\d*)\s*years?',
+        r'(\d+\.?\d*)\+\s*years?',
+    )]
+
+    # Direct mentions live almost always in the summary/header, so
+    # scan only this many leading characters before falling back to
+    # the full text
+    _DIRECT_MENTION_WINDOW = 4096
+
+    _MONTH_NAMES = (
+        None, 'january', 'february', 'march', 'april', 'may', 'june',
+        'july', 'august', 'september', 'october', 'november', 'december',
+    )
+
     def __init__(self, current_date: Optional[datetime] = None):
         """
         Initialize the experience extractor.
@@ -34,22 +100,6 @@ class ExperienceExtractor:
                          Defaults to today.
         """
         self.current_date = current_date or datetime.now()
-        
-        # Month name mappings
-        self.month_map = {
-            'jan': 1, 'january': 1,
-            'feb': 2, 'february': 2,
-            'mar': 3, 'march': 3,
-            'apr': 4, 'april': 4,
-            'may': 5,
-            'jun': 6, 'june': 6,
-            'jul': 7, 'july': 7,
-            'aug': 8, 'august': 8,
-            'sep': 9, 'sept': 9, 'september': 9,
-            'oct': 10, 'october': 10,
-            'nov': 11, 'november': 11,
-            'dec': 12, 'december': 12
-        }
 
     def extract_years_of_experience(self, text: str) -> float:
         """
@@ -102,18 +152,22 @@ class ExperienceExtractor:
         Returns:
             Years mentioned, or 0.0 if not found
         """
-        patterns = [
-            r'(\d+\.?\d*)\+?\s*years?\s+of\s+(?:work\s+)?experience',
-            r'(\d+\.?\d*)\+?\s*years?\s+(?:working|in)',
-            r'over\s+(\d+\.?\d*)\s*years?',
-            r'more\s+than\s+(\d+\.?\d*)\s*years?',
-            r'(\d+\.?\d*)\+\s*years?'
-        ]
-        
+        # Scan the head first — mentions cluster in the summary; only
+        # fall back to the (possibly much larger) full text on a miss
+        head = text[:self._DIRECT_MENTION_WINDOW]
+
+        found_years = self._find_direct_mentions(head)
+        if not found_years and len(text) > self._DIRECT_MENTION_WINDOW:
+            found_years = self._find_direct_mentions(text)
+
+        return max(found_years) if found_years else 0.0
+
+    def _find_direct_mentions(self, text: str) -> List[float]:
+        """Run all direct-mention patterns over text, sanity-checked."""
         found_years = []
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+
+        for pattern in self._DIRECT_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 try:
                     years = float(match)
@@ -121,8 +175,8 @@ class ExperienceExtractor:
                         found_years.append(years)
                 except ValueError:
                     continue
-        
-        return max(found_years) if found_years else 0.0
+
+        return found_years
 
     def _extract_date_ranges(self, text: str) -> List[Tuple[datetime, datetime]]:
         """
@@ -141,62 +195,50 @@ class ExperienceExtractor:
             List of (start_date, end_date) tuples
         """
         date_ranges = []
-        
-        # Pattern 1: "Month YYYY - Month YYYY"
-        # Example: "Jan 2020 - Mar 2023"
-        pattern1 = r'(\w+)\s+(\d{4})\s*[-–—]\s*(\w+)\s+(\d{4})'
-        matches1 = re.findall(pattern1, text, re.IGNORECASE)
-        
-        for match in matches1:
-            start_month, start_year, end_month, end_year = match
-            start_date = self._parse_month_year(start_month, start_year)
-            end_date = self._parse_month_year(end_month, end_year)
-            
-            if start_date and end_date:
-                date_ranges.append((start_date, end_date))
-        
-        # Pattern 2: "Month YYYY - Present"
-        pattern2 = r'(\w+)\s+(\d{4})\s*[-–—]\s*(present|current|now)'
-        matches2 = re.findall(pattern2, text, re.IGNORECASE)
-        
-        for match in matches2:
-            start_month, start_year, _ = match
-            start_date = self._parse_month_year(start_month, start_year)
-            
-            if start_date:
-                date_ranges.append((start_date, self.current_date))
-        
-        # Pattern 3: "YYYY - YYYY"
-        # Example: "2018 - 2023"
-        pattern3 = r'(\d{4})\s*[-–—]\s*(\d{4})'
-        matches3 = re.findall(pattern3, text)
-        
-        for match in matches3:
-            start_year, end_year = match
-            try:
-                start_date = datetime(int(start_year), 1, 1)
-                end_date = datetime(int(end_year), 12, 31)
-                
-                if 1970 <= start_date.year <= self.current_date.year:
+
+        for match in self._RANGE_RE.finditer(text):
+            if match['m2'] is not None:
+                # "Month YYYY - Month YYYY" — both months must parse
+                start_date = self._parse_month_year(match['m1'] or '', match['y1'])
+                end_date = self._parse_month_year(match['m2'], match['y2'])
+                if start_date and end_date:
                     date_ranges.append((start_date, end_date))
-            except ValueError:
-                continue
-        
-        # Pattern 4: "YYYY - Present"
-        pattern4 = r'(\d{4})\s*[-–—]\s*(present|current|now)'
-        matches4 = re.findall(pattern4, text, re.IGNORECASE)
-        
-        for match in matches4:
-            start_year, _ = match
-            try:
-                start_date = datetime(int(start_year), 1, 1)
-                if 1970 <= start_date.year <= self.current_date.year:
+            elif match['pres']:
+                # "Month YYYY - Present" / "YYYY - Present"
+                start_date = self._parse_month_year(match['m1'] or '', match['y1'])
+                if start_date:
                     date_ranges.append((start_date, self.current_date))
-            except ValueError:
-                continue
-        
+                else:
+                    self._append_year_range(date_ranges, match['y1'], None)
+            else:
+                # "YYYY - YYYY" (any leading word wasn't a month form)
+                self._append_year_range(date_ranges, match['y1'], match['y2'])
+
         return date_ranges
 
+    def _append_year_range(
+        self,
+        date_ranges: List[Tuple[datetime, datetime]],
+        start_year: str,
+        end_year: Optional[str],
+    ) -> None:
+        """
+        Append a year-granularity range; end_year=None means Present.
+
+        Start year must fall between 1970 and the current year.
+        """
+        try:
+            start_date = datetime(int(start_year), 1, 1)
+            if end_year is not None:
+                end_date = datetime(int(end_year), 12, 31)
+            else:
+                end_date = self.current_date
+        except ValueError:
+            return
+
+        if 1970 <= start_date.year <= self.current_date.year:
+            date_ranges.append((start_date, end_date))
+
     def _parse_month_year(self, month_str: str, year_str: str) -> Optional[datetime]:
         """
         Parse month and year strings into datetime.
@@ -210,16 +252,21 @@ class ExperienceExtractor:
         """
         try:
             year = int(year_str)
-            month_lower = month_str.lower().strip()
-            
-            # Try to get month from map
-            month = self.month_map.get(month_lower)
-            
-            if month and 1970 <= year <= self.current_date.year + 1:
-                return datetime(year, month, 1)
+
+            # Perfect-hash probe on the first three characters — no
+            # allocation on the (common) miss path. A hit still needs
+            # the prefix-of-full-name confirmation, so "marketing"
+            # doesn't parse as March.
+            month = _month_from_token(month_str)
+
+            if month:
+                month_lower = month_str.lower()
+                if (self._MONTH_NAMES[month].startswith(month_lower)
+                        and 1970 <= year <= self.current_date.year + 1):
+                    return datetime(year, month, 1)
         except (ValueError, AttributeError):
             pass
-        
+
         return None
 
     def _calculate_total_experience(self, date_ranges: List[Tuple[datetime, datetime]]) -> float:
@@ -243,11 +290,12 @@ class ExperienceExtractor:
         for start_date, end_date in date_ranges:
             if end_date < start_date:
                 continue
-            
-            # Calculate difference with month precision
-            delta = relativedelta(end_date, start_date)
-            years = delta.years + (delta.months / 12.0)
-            
+
+            # Month-precision difference via integer arithmetic — no
+            # calendar-aware object allocation needed at this granularity
+            months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
+            years = months / 12.0
+
             max_years = max(max_years, years)
         
         return round(max_years, 1)
@@ -266,9 +314,9 @@ class ExperienceExtractor:
         
         results = []
         for start_date, end_date in date_ranges:
-            delta = relativedelta(end_date, start_date)
-            years = delta.years + (delta.months / 12.0)
-            
+            months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
+            years = months / 12.0
+
             results.append({
                 'start': start_date.strftime('%B %Y'),
                 'end': end_date.strftime('%B %Y'),
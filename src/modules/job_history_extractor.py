@@ -4,16 +4,72 @@ Job History Extraction Module
 Extracts structured job history (title, company, dates, duration) from resume text.
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Tuple
 import re
 from datetime import datetime
 
-from dateutil.relativedelta import relativedelta
 import spacy
 
+from src.modules.experience_extractor import _month_from_token
 
-@dataclass
+
+@lru_cache(maxsize=1)
+def _get_spacy_model(name: str = "en_core_web_sm"):
+    """
+    Process-wide spaCy model singleton.
+
+    Loading en_core_web_sm reads ~50MB from disk and builds the
+    pipeline; extractors are often instantiated per resume or per
+    worker, so the loaded model is cached and shared. Only NER output
+    is consumed — the other components are excluded so their weights
+    are never loaded (tok2vec stays; NER listens to it).
+    """
+    try:
+        return spacy.load(
+            name,
+            exclude=["tagger", "parser", "attribute_ruler", "lemmatizer"],
+        )
+    except OSError as e:
+        raise RuntimeError(
+            f"spaCy model '{name}' not found. "
+            f"Run: python -m spacy download {name}"
+        ) from e
+
+# Both date-line patterns fused into one alternation scanned once
+# over the whole joined text instead of two searches per line. The
+# "mo" branch covers "Jan 2020 - Mar 2023" / "January 2020 – Present",
+# the "yr" branch "2018 - 2023" / "2018 - Present". [^\S\n] is
+# whitespace-except-newline, keeping matches within a single line.
+_DATE_LINE_RE = re.compile(
+    r'(?P<mo>(?P<m1>\b\w+\b)[^\S\n]+(?P<my1>\d{4})[^\S\n]*[-–—][^\S\n]*'
+    r'(?P<m2>\b\w+\b)[^\S\n]*(?P<my2>\d{4})?)'
+    r'|(?P<yr>(?P<y1>\d{4})[^\S\n]*[-–—][^\S\n]*'
+    r'(?P<y2>\d{4}|\bpresent\b|\bcurrent\b|\bnow\b))',
+    re.IGNORECASE,
+)
+
+# Company heuristics for _extract_company_simple
+_AT_PATTERN = re.compile(r'\bat\s+([A-Z][A-Za-z0-9&.\s]+)')
+_SUFFIX_PATTERN = re.compile(
+    r'([A-Z][A-Za-z0-9&.\s]+?\s+(?:Inc\.?|LLC|Ltd\.?|GmbH|Corp\.?))'
+)
+
+# Whitespace collapse for _clean_title
+_WS_PATTERN = re.compile(r'\s+')
+
+# Sort-key sentinel for entries with no start date — built once instead
+# of allocating a fresh datetime per entry on every sort
+_EPOCH = datetime(1900, 1, 1)
+
+
+def _entry_sort_key(entry: "JobHistoryEntry") -> datetime:
+    return entry.start_date or _EPOCH
+
+
+@dataclass(slots=True)
 class JobHistoryEntry:
     title: str
     company: Optional[str]
@@ -68,41 +124,28 @@ class JobHistoryExtractor:
     - Duration in years
     """
 
+    # Bound on the context → ORG memo below
+    _ORG_CACHE_MAX = 4096
+
+    _MONTH_NAMES = (
+        None, 'january', 'february', 'march', 'april', 'may', 'june',
+        'july', 'august', 'september', 'october', 'november', 'december',
+    )
+
     def __init__(self, use_nlp: bool = True, current_date: Optional[datetime] = None):
         self.use_nlp = use_nlp
         self.current_date = current_date or datetime.now()
         self._nlp = None
+        self._org_cache: dict = {}
 
         if self.use_nlp:
             self._load_spacy_model()
 
-        # Month mapping
-        self.month_map = {
-            'jan': 1, 'january': 1,
-            'feb': 2, 'february': 2,
-            'mar': 3, 'march': 3,
-            'apr': 4, 'april': 4,
-            'may': 5,
-            'jun': 6, 'june': 6,
-            'jul': 7, 'july': 7,
-            'aug': 8, 'august': 8,
-            'sep': 9, 'sept': 9, 'september': 9,
-            'oct': 10, 'october': 10,
-            'nov': 11, 'november': 11,
-            'dec': 12, 'december': 12
-        }
-
     def _load_spacy_model(self):
         if self._nlp is not None:
             return
 
-        try:
-            self._nlp = spacy.load("en_core_web_sm")
-        except OSError as e:
-            raise RuntimeError(
-                "spaCy model 'en_core_web_sm' not found. "
-                "Run: python -m spacy download en_core_web_sm"
-            ) from e
+        self._nlp = _get_spacy_model()
 
     def extract_job_history(self, text: str) -> List[JobHistoryEntry]:
         """
@@ -117,25 +160,43 @@ class JobHistoryExtractor:
         if not text or not text.strip():
             return []
 
-        lines = [line.strip() for line in text.splitlines()]
-        # Remove empty lines but keep index mapping
-        indexed_lines = [(i, line) for i, line in enumerate(lines) if line]
+        # One pass over the text: strip each line once, drop empties,
+        # keep the original index. The dict view serves the look-back
+        # in _title_and_context without re-indexing and re-stripping.
+        indexed_lines = [
+            (i, s) for i, s in enumerate(map(str.strip, text.splitlines())) if s
+        ]
+        stripped_by_index = dict(indexed_lines)
 
         # 1. Find date range lines
         date_lines = self._find_date_lines(indexed_lines)
 
-        # 2. For each date line, find context (title + company)
-        entries: List[JobHistoryEntry] = []
-        for idx, (line_index, date_match) in enumerate(date_lines):
+        # 2. Collect context (title + candidate company lines) for
+        #    every valid date line before touching spaCy
+        items = []
+        for line_index, date_match in date_lines:
             start_date, end_date = self._parse_date_match(date_match)
             if not start_date or not end_date:
                 continue
 
             # Look back 1–2 non-empty lines for title/company
-            title, company = self._infer_title_and_company(
-                lines, line_index, window=2
-            )
+            title, context = self._title_and_context(stripped_by_index, line_index, window=2)
+            if not title:
+                continue
+
+            items.append((title, context, start_date, end_date))
+
+        # 3. Resolve companies for all contexts in one spaCy batch
+        companies = self._companies_for_contexts([c for _, c, _, _ in items])
 
+        entries: List[JobHistoryEntry] = []
+        for (title, context, start_date, end_date), company in zip(items, companies):
+            # If NLP fails, try simple heuristic:
+            if not company:
+                company = self._extract_company_simple(context)
+
+            # Clean title (remove trailing punctuation, location, etc.)
+            title = self._clean_title(title, company)
             if not title:
                 continue
 
@@ -151,10 +212,7 @@ class JobHistoryExtractor:
             entries.append(entry)
 
         # 3. Sort by start_date descending (most recent first)
-        entries.sort(
-            key=lambda e: e.start_date or datetime(1900, 1, 1),
-            reverse=True
-        )
+        entries.sort(key=_entry_sort_key, reverse=True)
         return entries
 
     def _find_date_lines(self, indexed_lines: List[Tuple[int, str]]) -> List[Tuple[int, re.Match]]:
@@ -164,84 +222,80 @@ class JobHistoryExtractor:
         Returns:
             List of (line_index, regex_match)
         """
-        date_lines = []
-
-        # Pattern: "Jan 2020 - Mar 2023" or "January 2020 – Present"
-        pattern_month = re.compile(
-            r'(\b\w+\b)\s+(\d{4})\s*[-–—]\s*(\b\w+\b|\bpresent\b|\bcurrent\b|\bnow\b)\s*(\d{4})?',
-            re.IGNORECASE,
-        )
-
-        # Pattern: "2018 - 2023" or "2018 - Present"
-        pattern_year = re.compile(
-            r'(\d{4})\s*[-–—]\s*(\d{4}|\bpresent\b|\bcurrent\b|\bnow\b)',
-            re.IGNORECASE,
-        )
-
-        for idx, line in indexed_lines:
-            m1 = pattern_month.search(line)
-            if m1:
-                date_lines.append((idx, m1))
-                continue
-
-            m2 = pattern_year.search(line)
-            if m2:
-                date_lines.append((idx, m2))
+        if not indexed_lines:
+            return []
 
-        return date_lines
+        # One C-level scan over the joined text instead of two
+        # pattern searches per line; matches map back to lines by
+        # bisecting precomputed line-start offsets
+        joined = "\n".join(line for _, line in indexed_lines)
+        offsets = []
+        pos = 0
+        for _, line in indexed_lines:
+            offsets.append(pos)
+            pos += len(line) + 1
+
+        # Keep one match per line: the first month-form match wins
+        # over a year-form one, mirroring the old two-pass priority
+        by_line = {}
+        for m in _DATE_LINE_RE.finditer(joined):
+            li = bisect_right(offsets, m.start()) - 1
+            existing = by_line.get(li)
+            if existing is None or (
+                existing['mo'] is None and m['mo'] is not None
+            ):
+                by_line[li] = m
+
+        return [
+            (indexed_lines[li][0], m) for li, m in sorted(by_line.items())
+        ]
 
     def _parse_date_match(self, match: re.Match) -> Tuple[Optional[datetime], Optional[datetime]]:
         """
         Parse regex match into (start_date, end_date).
-        Handles both month-year and year-only patterns.
+        Dispatches on which branch of the fused pattern matched.
         """
-        groups = match.groups()
-
-        # Month-year pattern: (start_month, start_year, end_month_or_word, end_year_optional)
-        if len(groups) == 4:
-            start_month, start_year, end_part, end_year_optional = groups
-            start_date = self._parse_month_year(start_month, start_year)
+        # Month-year branch: start_month, start_year, end_month_or_word,
+        # optional end_year
+        if match['mo'] is not None:
+            start_date = self._parse_month_year(match['m1'], match['my1'])
 
             # End: could be month+year or a word like "present"
-            end_str = end_part.lower()
+            end_str = match['m2'].lower()
             if end_str in {"present", "current", "now"}:
                 end_date = self.current_date
             else:
                 # If a separate end year exists, use it; else treat end_part as month and reuse start_year
-                end_year = end_year_optional or start_year
-                end_date = self._parse_month_year(end_part, end_year)
+                end_year = match['my2'] or match['my1']
+                end_date = self._parse_month_year(match['m2'], end_year)
 
             return start_date, end_date
 
-        # Year-only pattern: (start_year, end_year_or_word)
-        if len(groups) == 2:
-            start_year, end_part = groups
+        # Year-only branch: (start_year, end_year_or_word)
+        try:
+            start_y = int(match['y1'])
+        except ValueError:
+            return None, None
+
+        if start_y < 1970 or start_y > self.current_date.year:
+            return None, None
+
+        start_date = datetime(start_y, 1, 1)
+
+        end_str = match['y2'].lower()
+        if end_str in {"present", "current", "now"}:
+            end_date = self.current_date
+        else:
             try:
-                start_y = int(start_year)
+                end_y = int(end_str)
             except ValueError:
                 return None, None
-
-            if start_y < 1970 or start_y > self.current_date.year:
+            # Sanity: not too far in future
+            if end_y < start_y or end_y > self.current_date.year + 1:
                 return None, None
+            end_date = datetime(end_y, 12, 31)
 
-            start_date = datetime(start_y, 1, 1)
-
-            end_str = end_part.lower()
-            if end_str in {"present", "current", "now"}:
-                end_date = self.current_date
-            else:
-                try:
-                    end_y = int(end_str)
-                except ValueError:
-                    return None, None
-                # Sanity: not too far in future
-                if end_y < start_y or end_y > self.current_date.year + 1:
-                    return None, None
-                end_date = datetime(end_y, 12, 31)
-
-            return start_date, end_date
-
-        return None, None
+        return start_date, end_date
 
     def _parse_month_year(self, month_str: str, year_str: str) -> Optional[datetime]:
         """Parse strings like ('Jan', '2020') into datetime(2020, 1, 1)."""
@@ -250,30 +304,42 @@ class JobHistoryExtractor:
         except ValueError:
             return None
 
-        month_key = month_str.lower().strip()
-        month = self.month_map.get(month_key)
-        if not month:
+        # Cheap integer bounds check before any month work
+        if year < 1970 or year > self.current_date.year + 1:
             return None
 
-        if year < 1970 or year > self.current_date.year + 1:
+        # Perfect-hash probe on the first three characters (shared with
+        # ExperienceExtractor), then confirm the whole token is a
+        # prefix of that month's full name
+        month = _month_from_token(month_str)
+        if not month:
+            return None
+        month_lower = month_str.lower()
+        if not self._MONTH_NAMES[month].startswith(month_lower):
             return None
 
         return datetime(year, month, 1)
 
-    def _infer_title_and_company(self, lines: List[str], date_line_index: int, window: int = 2) -> Tuple[Optional[str], Optional[str]]:
+    def _title_and_context(self, stripped_lines: dict, date_line_index: int, window: int = 2) -> Tuple[Optional[str], Optional[str]]:
         """
-        Look at lines above the date line to infer title and company.
+        Look at lines above the date line for the raw title and the
+        context string used for company resolution.
 
         Args:
-            lines: All lines of text
+            stripped_lines: Mapping original line index -> stripped
+                            non-empty line (empty lines are absent)
             date_line_index: Index of the line containing date range
             window: How many lines above to consider
 
         Returns:
-            (title, company)
+            (raw_title, context) — title still needs _clean_title
         """
         start_idx = max(0, date_line_index - window)
-        candidate_lines = [lines[i].strip() for i in range(start_idx, date_line_index) if lines[i].strip()]
+        candidate_lines = [
+            stripped_lines[i]
+            for i in range(start_idx, date_line_index)
+            if i in stripped_lines
+        ]
 
         if not candidate_lines:
             return None, None
@@ -282,38 +348,72 @@ class JobHistoryExtractor:
         context = " ".join(candidate_lines[-2:])  # up to 2 lines combined
         title = candidate_lines[-1]
 
-        company = None
-        if self.use_nlp and self._nlp is not None:
-            company = self._extract_company_with_nlp(context)
+        return title, context
+
+    def _companies_for_contexts(self, contexts: List[str]) -> List[Optional[str]]:
+        """
+        Resolve the company for each context, batched through spaCy.
+
+        nlp.pipe amortizes the per-doc pipeline overhead across all
+        contexts of the resume instead of paying it once per date line.
+        """
+        if not contexts:
+            return []
+
+        if not (self.use_nlp and self._nlp is not None):
+            return [None] * len(contexts)
 
-        # If NLP fails, try simple heuristic:
-        if not company:
-            company = self._extract_company_simple(context)
+        # Only pipe contexts the ORG cache hasn't seen; near-duplicate
+        # contexts recur across a corpus and skip spaCy entirely
+        keys = [c.strip() for c in contexts]
+        miss_keys = list(dict.fromkeys(
+            k for k in keys if k not in self._org_cache
+        ))
 
-        # Clean title (remove trailing punctuation, location, etc.)
-        title = self._clean_title(title, company)
+        for key, doc in zip(miss_keys, self._nlp.pipe(miss_keys, batch_size=32)):
+            orgs = [ent.text.strip() for ent in doc.ents if ent.label_ == "ORG"]
+            self._store_org(key, orgs[0] if orgs else None)
 
-        return title if title else None, company
+        return [self._org_cache.get(k) for k in keys]
 
     def _extract_company_with_nlp(self, text: str) -> Optional[str]:
-        """Use spaCy ORG entities to infer company."""
-        doc = self._nlp(text)
+        """Use spaCy ORG entities to infer company (memoized)."""
+        key = text.strip()
+        if key in self._org_cache:
+            return self._org_cache[key]
+
+        doc = self._nlp(key)
         orgs = [ent.text.strip() for ent in doc.ents if ent.label_ == "ORG"]
-        return orgs[0] if orgs else None
+        org = orgs[0] if orgs else None
+        self._store_org(key, org)
+        return org
+
+    def _store_org(self, context: str, org: Optional[str]) -> None:
+        """Remember the ORG result for a context, bounded in size."""
+        if len(self._org_cache) >= self._ORG_CACHE_MAX:
+            self._org_cache.clear()
+        self._org_cache[context] = org
 
     def _extract_company_simple(self, text: str) -> Optional[str]:
         """
         Simple heuristic: look for patterns like 'at X', 'X, Inc', 'X Ltd'.
         """
+        # Cheap C-level substring probes gate each regex: most clean
+        # title lines contain none of these markers, so the common
+        # path skips the regex engine entirely
+        text_lower = text.lower()
+
         # Pattern: 'at Company Name'
-        m = re.search(r'\bat\s+([A-Z][A-Za-z0-9&.\s]+)', text)
-        if m:
-            return m.group(1).strip()
+        if 'at ' in text_lower:
+            m = _AT_PATTERN.search(text)
+            if m:
+                return m.group(1).strip()
 
         # Pattern: 'Company Name, Inc.' or 'Company Name Ltd'
-        m = re.search(r'([A-Z][A-Za-z0-9&.\s]+?\s+(?:Inc\.?|LLC|Ltd\.?|GmbH|Corp\.?))', text)
-        if m:
-            return m.group(1).strip()
+        if any(s in text_lower for s in ('inc', 'llc', 'ltd', 'gmbh', 'corp')):
+            m = _SUFFIX_PATTERN.search(text)
+            if m:
+                return m.group(1).strip()
 
         # Fallback: if there's a comma, assume after comma is company
         if "," in text:
@@ -336,7 +436,7 @@ class JobHistoryExtractor:
             t = t.split("|")[0].strip()
 
         # Basic cleanup
-        t = re.sub(r'\s+', ' ', t)
+        t = _WS_PATTERN.sub(' ', t)
         return t
 
     def _compute_duration_years(self, start_date: datetime, end_date: datetime) -> float:
@@ -344,6 +444,7 @@ class JobHistoryExtractor:
         if end_date < start_date:
             return 0.0
 
-        delta = relativedelta(end_date, start_date)
-        years = delta.years + delta.months / 12.0
-        return round(years, 1)
+        # Month-precision difference via integer arithmetic — no
+        # calendar-aware object allocation needed at this granularity
+        months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
+        return round(months / 12.0, 1)
@@ -11,10 +11,13 @@ Pipeline:
         → JobProfile               (final dataclass output)
 """
 
+import hashlib
 import logging
 import numpy as np
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from src.modules.job_parser import JobProfile
 from src.modules.job_text_normaliser import JobTextNormalizer
@@ -23,6 +26,29 @@ from src.modules.embeddings_creator import EmbeddingsCreator
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only zero vector for the empty-JD path — avoids a fresh
+# np.zeros(384) allocation per malformed input
+_EMPTY_EMBEDDING = np.zeros(384, dtype=np.float32)
+_EMPTY_EMBEDDING.setflags(write=False)
+
+
+@dataclass(slots=True)
+class ExtractedRequirements:
+    """
+    Typed hand-off between the pipeline steps.
+
+    The extractor's dict is converted to this once, so the embedding
+    and profile-assembly steps read slot attributes instead of
+    repeating defaulted dict lookups per field.
+    """
+    title: str = ""
+    company: str = ""
+    location: str = ""
+    required_hard_skills: List[str] = field(default_factory=list)
+    nice_to_have_skills: List[str] = field(default_factory=list)
+    required_experience_years: float = 0.0
+    required_education: str = ""
+
 
 class JobOrchestrator:
     """
@@ -42,6 +68,9 @@ class JobOrchestrator:
         print(profile.job_embedding.shape)  # (384,)
     """
 
+    # Max number of processed profiles kept in the memo cache
+    _MEMO_MAX = 1024
+
     def __init__(self, embeddings_creator: Optional[EmbeddingsCreator] = None):
         """
         Initialize all pipeline components.
@@ -56,13 +85,17 @@ class JobOrchestrator:
         self.extractor  = JobRequirementsExtractor()
         self.embedder   = embeddings_creator or EmbeddingsCreator()
 
+        # LRU memo: digest of raw JD text → processed JobProfile.
+        # Re-posted/duplicate JDs skip the whole pipeline.
+        self._memo: OrderedDict = OrderedDict()
+
         logger.info("JobOrchestrator initialized")
 
     # ------------------------------------------------------------------
     # PUBLIC API
     # ------------------------------------------------------------------
 
-    def process(self, jd_text: str) -> JobProfile:
+    def process(self, jd_text: str, now: Optional[datetime] = None) -> JobProfile:
         """
         Process raw job description text into a fully populated JobProfile.
 
@@ -70,6 +103,8 @@ class JobOrchestrator:
 
         Args:
             jd_text: Raw job description text (any format)
+            now: Timestamp for created_at — pass a shared value when
+                 batching (see process_batch); defaults to datetime.now()
 
         Returns:
             JobProfile dataclass with all fields populated
@@ -93,11 +128,19 @@ class JobOrchestrator:
                 nice_to_have_skills=[],
                 required_experience_years=0.0,
                 required_education="",
-                job_embedding=np.zeros(384),
+                job_embedding=_EMPTY_EMBEDDING,
                 skills_embeddings={},
-                created_at=datetime.now(),
+                created_at=now or datetime.now(),
             )
 
+        # Memo hit: identical JD text was already processed
+        memo_key = hashlib.blake2b(jd_text.encode(), digest_size=16).digest()
+        cached = self._memo.get(memo_key)
+        if cached is not None:
+            self._memo.move_to_end(memo_key)
+            logger.debug("Memo hit — returning cached JobProfile")
+            return cached
+
         logger.info("Starting job description processing pipeline")
 
         # Step 1: Normalize
@@ -110,16 +153,39 @@ class JobOrchestrator:
         embeddings = self._create_embeddings(requirements)
 
         # Step 4: Assemble final profile
-        profile = self._build_profile(requirements, embeddings)
+        profile = self._build_profile(requirements, embeddings, now=now)
 
         logger.info(
-            f"Pipeline complete — title='{profile.title}', "
-            f"required_skills={len(profile.required_hard_skills)}, "
-            f"nice_to_have={len(profile.nice_to_have_skills)}"
+            "Pipeline complete — title='%s', required_skills=%d, nice_to_have=%d",
+            profile.title,
+            len(profile.required_hard_skills),
+            len(profile.nice_to_have_skills),
         )
 
+        self._memo[memo_key] = profile
+        if len(self._memo) > self._MEMO_MAX:
+            self._memo.popitem(last=False)
+
         return profile
 
+    def process_batch(self, jd_texts: List[str]) -> List[JobProfile]:
+        """
+        Process a sequence of job descriptions.
+
+        One datetime.now() is captured for the whole batch and stamped
+        on every profile — one clock read instead of one per JD, and
+        all profiles from a run share the same created_at, which makes
+        batch provenance easier to query.
+
+        Args:
+            jd_texts: Raw job description texts
+
+        Returns:
+            List of JobProfile, same order as the input
+        """
+        batch_now = datetime.now()
+        return [self.process(jd_text, now=batch_now) for jd_text in jd_texts]
+
     # ------------------------------------------------------------------
     # PRIVATE HELPERS
     # ------------------------------------------------------------------
@@ -135,84 +201,104 @@ class JobOrchestrator:
             Cleaned, normalized text
         """
         normalized = self.normalizer.normalize(jd_text)
-        logger.debug(f"Normalized text length: {len(normalized)} chars")
+        logger.debug("Normalized text length: %d chars", len(normalized))
         return normalized
 
-    def _extract_requirements(self, normalized_text: str) -> dict:
+    def _extract_requirements(self, normalized_text: str) -> ExtractedRequirements:
         """
         Step 2: Extract all structured requirements from normalized text.
 
-        Delegates to JobRequirementsExtractor and returns results
-        as a plain dictionary for easy passing between steps.
+        Delegates to JobRequirementsExtractor and converts its dict
+        into the typed ExtractedRequirements hand-off, so later steps
+        read attributes instead of re-doing defaulted dict lookups.
 
         Args:
             normalized_text: Cleaned JD text from Step 1
 
         Returns:
-            Dictionary with keys:
-              title, company, location,
-              required_hard_skills, nice_to_have_skills,
-              required_experience_years, required_education
+            ExtractedRequirements with all fields populated
         """
         result = self.extractor.extract(normalized_text)
 
+        requirements = ExtractedRequirements(
+            title=result.get("title", ""),
+            company=result.get("company", ""),
+            location=result.get("location", ""),
+            required_hard_skills=result.get("required_hard_skills", []),
+            nice_to_have_skills=result.get("nice_to_have_skills", []),
+            required_experience_years=result.get("required_experience_years", 0.0),
+            required_education=result.get("required_education", ""),
+        )
+
         logger.debug(
-            f"Extracted — title='{result.get('title')}', "
-            f"required={result.get('required_hard_skills', [])}"
+            "Extracted — title='%s', required=%s",
+            requirements.title, requirements.required_hard_skills,
         )
 
-        return result
+        return requirements
 
-    def _create_embeddings(self, requirements: dict) -> dict:
+    def _create_embeddings(self, requirements: ExtractedRequirements) -> dict:
         """
         Step 3: Create job-level and skill-level embeddings.
 
         Delegates to EmbeddingsCreator.create_job_embeddings().
 
         Args:
-            requirements: Dictionary output from Step 2
+            requirements: ExtractedRequirements from Step 2
 
         Returns:
             Dictionary with keys:
               job_embedding, skills_embeddings, summary_text
         """
         embeddings = self.embedder.create_job_embeddings(
-            title=requirements.get("title", ""),
-            required_hard_skills=requirements.get("required_hard_skills", []),
-            nice_to_have_skills=requirements.get("nice_to_have_skills", []),
-            required_experience_years=requirements.get("required_experience_years", 0.0),
-            required_education=requirements.get("required_education", ""),
+            title=requirements.title,
+            required_hard_skills=requirements.required_hard_skills,
+            nice_to_have_skills=requirements.nice_to_have_skills,
+            required_experience_years=requirements.required_experience_years,
+            required_education=requirements.required_education,
         )
 
-        logger.debug(
-            f"Embeddings created — "
-            f"job_embedding shape: {embeddings['job_embedding'].shape}, "
-            f"skills: {list(embeddings['skills_embeddings'].keys())}"
-        )
+        # Guarded: building the skills list just for a log line is
+        # wasted work when DEBUG is off
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Embeddings created — job_embedding shape: %s, skills: %s",
+                embeddings['job_embedding'].shape,
+                embeddings['skills_names'],
+            )
 
         return embeddings
 
-    def _build_profile(self, requirements: dict, embeddings: dict) -> JobProfile:
+    def _build_profile(
+        self,
+        requirements: ExtractedRequirements,
+        embeddings: dict,
+        now: Optional[datetime] = None,
+    ) -> JobProfile:
         """
         Step 4: Assemble final JobProfile dataclass from all extracted data.
 
         Args:
-            requirements: Dictionary from Step 2 (extracted fields)
+            requirements: ExtractedRequirements from Step 2
             embeddings:   Dictionary from Step 3 (vectors)
+            now:          Shared created_at timestamp when batching
 
         Returns:
             Fully populated JobProfile dataclass
         """
         return JobProfile(
             version="1.0",
-            title=requirements.get("title", ""),
-            company=requirements.get("company", ""),
-            location=requirements.get("location", ""),
-            required_hard_skills=requirements.get("required_hard_skills", []),
-            nice_to_have_skills=requirements.get("nice_to_have_skills", []),
-            required_experience_years=requirements.get("required_experience_years", 0.0),
-            required_education=requirements.get("required_education", ""),
-            job_embedding=embeddings["job_embedding"],
+            title=requirements.title,
+            company=requirements.company,
+            location=requirements.location,
+            required_hard_skills=requirements.required_hard_skills,
+            nice_to_have_skills=requirements.nice_to_have_skills,
+            required_experience_years=requirements.required_experience_years,
+            required_education=requirements.required_education,
+            # float16 storage halves the profile's embedding footprint;
+            # unit-norm vectors lose no meaningful cosine precision and
+            # np.dot upcasts transparently downstream
+            job_embedding=embeddings["job_embedding"].astype(np.float16),
             skills_embeddings=embeddings["skills_embeddings"],
-            created_at=datetime.now(),
+            created_at=now or datetime.now(),
         )
@@ -10,7 +10,7 @@ from typing import List, Dict
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class JobProfile:
     """
     Structured representation of a job description.
@@ -25,6 +25,10 @@ class JobProfile:
         required_experience_years: Minimum years of experience required.
         required_education: Text describing education requirements.
         job_embedding: Embedding vector representing the job as a whole.
+            Stored as float16 — safe for cosine similarity of
+            unit-norm vectors and half the bytes of float32.
+        job_embedding_scale: Dequantization scale for job_embedding
+            (1.0 for float16 storage; set when int8-quantized).
         skills_embeddings: Mapping skill -> embedding vector.
         created_at: Timestamp when this JobProfile was created.
     """
@@ -39,3 +43,4 @@ class JobProfile:
     job_embedding: np.ndarray
     skills_embeddings: Dict[str, np.ndarray]
     created_at: datetime
+    job_embedding_scale: float = 1.0
@@ -11,7 +11,9 @@ Extracts structured information from a job description:
   - Required education
 """
 
+from collections import OrderedDict
 from typing import List, Dict, Tuple, Optional
+import hashlib
 import re
 
 from src.modules.skills_extractor import SkillsExtractor
@@ -67,10 +69,66 @@ class JobRequirementsExtractor:
         "associate", "senior", "junior", "staff", "principal"
     ]
 
+    # Each keyword list unioned into one compiled alternation, built
+    # once at class load. One regex scan per line replaces a Python
+    # loop of substring probes (~12 per list); plain alternation (no
+    # \b) keeps exact substring-containment semantics, and IGNORECASE
+    # spares the per-line .lower() allocation.
+    #
+    # The three heading lists share a single pattern with one named
+    # group per section, so classifying a heading line is ONE linear
+    # pass reporting which groups hit — the multi-needle scan an
+    # Aho-Corasick automaton would do, without a new dependency.
+    _HEADING_RE = re.compile(
+        "(?P<preferred>" + "|".join(map(re.escape, PREFERRED_HEADINGS)) + ")"
+        "|(?P<required>" + "|".join(map(re.escape, REQUIRED_HEADINGS)) + ")"
+        "|(?P<responsibility>"
+        + "|".join(map(re.escape, RESPONSIBILITY_HEADINGS)) + ")",
+        re.IGNORECASE
+    )
+    _DEGREE_RE = re.compile(
+        "|".join(map(re.escape, DEGREE_KEYWORDS)), re.IGNORECASE
+    )
+    _TITLE_RE = re.compile(
+        "|".join(map(re.escape, TITLE_KEYWORDS)), re.IGNORECASE
+    )
+
+    # Leading bullet/symbol noise stripped off education lines
+    _BULLET_RE = re.compile(r'^[\-\*\•\–\·\s]+')
+
+    # All six experience-year patterns fused into one alternation —
+    # a single finditer sweep over the section instead of six findall
+    # passes. Each branch names its year group, so the matched value
+    # is m.group(m.lastgroup); the regex itself guarantees the capture
+    # is a valid float literal.
+    _EXPERIENCE_RE = re.compile(
+        # "at least X years" / "minimum X years"
+        r'(?:at\s+least|minimum|min\.?)\s+(?P<a>\d+\.?\d*)\s*\+?\s*years?'
+        # "X+ years of experience"
+        r'|(?P<b>\d+\.?\d*)\s*\+\s*years?\s+of\s+(?:\w+\s+)?experience'
+        # "X years of experience"
+        r'|(?P<c>\d+\.?\d*)\s+years?\s+of\s+(?:\w+\s+)?experience'
+        # "X-Y years" → take X (lower bound)
+        r'|(?P<d>\d+)\s*[-–]\s*\d+\s*years?'
+        # "X to Y years" → take X (lower bound)
+        r'|(?P<e>\d+)\s+to\s+\d+\s*years?'
+        # "X years working / in / as"
+        r'|(?P<f>\d+\.?\d*)\s*\+?\s*years?\s+(?:working|in|as)',
+        re.IGNORECASE
+    )
+
+    # Max number of extraction results kept in the memo cache
+    _MEMO_MAX = 4096
+
     def __init__(self):
         """Initialize with skills extractor."""
         self.skills_extractor = SkillsExtractor()
 
+        # LRU memo: digest of JD text → extraction result. The same
+        # posting reposted across boards skips every regex pass and
+        # SkillsExtractor call.
+        self._memo: OrderedDict = OrderedDict()
+
 
     def extract(self, text: str) -> dict:
         """
@@ -92,19 +150,26 @@ class JobRequirementsExtractor:
         if not text or not text.strip():
             return self._empty_result()
 
+        memo_key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        cached = self._memo.get(memo_key)
+        if cached is not None:
+            self._memo.move_to_end(memo_key)
+            return cached
+
         # Step 1: Split into sections
         sections = self._split_into_sections(text)
 
         # Step 2: Extract title, company, location from header
         title, company, location = self._extract_header_info(text)
 
-        # Step 3: Extract skills from sections
-        required_hard_skills = self._extract_skills_from_section(
-            sections.get("required", "")
-        )
-        nice_to_have_skills = self._extract_skills_from_section(
-            sections.get("preferred", "")
-        )
+        # Step 3: Extract skills from sections — one batched call so
+        # spaCy pipes both sections through the model together
+        skills_batch = self.skills_extractor.extract_skills_batch([
+            sections.get("required", ""),
+            sections.get("preferred", ""),
+        ])
+        required_hard_skills = skills_batch[0][0]
+        nice_to_have_skills = skills_batch[1][0]
 
         # Deduplicate nice-to-have against required
         nice_to_have_skills = [
@@ -120,7 +185,7 @@ class JobRequirementsExtractor:
         # Step 5: Extract education
         required_education = self._extract_education_requirement(search_text)
 
-        return {
+        result = {
             "title": title,
             "company": company,
             "location": location,
@@ -130,6 +195,12 @@ class JobRequirementsExtractor:
             "required_education": required_education,
         }
 
+        self._memo[memo_key] = result
+        if len(self._memo) > self._MEMO_MAX:
+            self._memo.popitem(last=False)
+
+        return result
+
     def _empty_result(self) -> dict:
         """Return empty result for empty input."""
         return {
@@ -151,57 +222,68 @@ class JobRequirementsExtractor:
           - "preferred": text under nice-to-have heading
           - "responsibilities": text under responsibilities heading
           - "other": everything else
+
+        Section bodies are slices of the original text — body lines
+        are never copied out or stripped individually; only candidate
+        heading lines (short ones) get materialized for inspection.
+        Adjacent body lines coalesce into one span, so a section with
+        no interior heading costs a single slice.
         """
-        lines = text.splitlines()
-        sections = {
+        spans: Dict[str, list] = {
             "required": [],
             "preferred": [],
             "responsibilities": [],
             "other": []
         }
 
-        current_section = "other"
-
-        for line in lines:
-            stripped = line.strip()
-            stripped_lower = stripped.lower()
-
-            # Check if this line is a section heading
-            is_required = any(
-                h in stripped_lower
-                for h in self.REQUIRED_HEADINGS
-            )
-            is_preferred = any(
-                h in stripped_lower
-                for h in self.PREFERRED_HEADINGS
-            )
-            is_responsibility = any(
-                h in stripped_lower
-                for h in self.RESPONSIBILITY_HEADINGS
-            )
-
-            # A heading line: short, likely no punctuation at end
-            is_heading = (
-                len(stripped) < 60 and
-                (is_required or is_preferred or is_responsibility) and
-                not stripped.endswith(",")
-            )
-
-            if is_heading:
-                if is_preferred:
-                    current_section = "preferred"
-                elif is_required:
-                    current_section = "required"
-                elif is_responsibility:
-                    current_section = "responsibilities"
+        current_spans = spans["other"]
+
+        # pos < n (not <=) so a trailing newline doesn't produce a
+        # phantom empty last line, matching splitlines()
+        pos = 0
+        n = len(text)
+        while pos < n:
+            nl = text.find("\n", pos)
+            end = n if nl == -1 else nl
+
+            # Heading lines are short and don't end in a comma; long
+            # lines are body text and never need slicing at all
+            section = None
+            if end - pos < 200:
+                stripped = text[pos:end].strip()
+                if len(stripped) < 60 and not stripped.endswith(","):
+                    is_required = is_preferred = is_responsibility = False
+                    for m in self._HEADING_RE.finditer(stripped):
+                        if m['preferred'] is not None:
+                            is_preferred = True
+                        elif m['required'] is not None:
+                            is_required = True
+                        else:
+                            is_responsibility = True
+
+                    if is_preferred:
+                        section = "preferred"
+                    elif is_required:
+                        section = "required"
+                    elif is_responsibility:
+                        section = "responsibilities"
+
+            if section is not None:
                 # Don't add the heading line itself
-                continue
+                current_spans = spans[section]
+            elif current_spans and current_spans[-1][1] == pos - 1:
+                # Extend the previous span across the shared newline
+                current_spans[-1][1] = end
+            else:
+                current_spans.append([pos, end])
 
-            sections[current_section].append(stripped)
+            if nl == -1:
+                break
+            pos = nl + 1
 
         return {
-            key: "\n".join(lines_list)
-            for key, lines_list in sections.items()
+            key: "\n".join(text[s:e] for s, e in span_list)
+            for key, span_list in spans.items()
         }
 
     def _extract_header_info(self, text: str) -> Tuple[str, str, str]:
@@ -248,13 +330,19 @@ class JobRequirementsExtractor:
                 # No separator → treat whole line as company
                 company = second_line
 
-        # Fallback: search for explicit labels anywhere in first 10 lines
-        for line in lines[:10]:
-            line_lower = line.lower()
-            if "location:" in line_lower:
-                location = line.split(":", 1)[-1].strip()
-            if "company:" in line_lower:
-                company = line.split(":", 1)[-1].strip()
+        # Fallback: search for explicit labels anywhere in first 10
+        # lines — only when the header lines left a gap. A label needs
+        # a colon, so the cheap ':' probe skips the .lower() allocation
+        # on the lines that can't match
+        if not (company and location):
+            for line in lines[:10]:
+                if ":" not in line:
+                    continue
+                line_lower = line.lower()
+                if "location:" in line_lower:
+                    location = line.split(":", 1)[-1].strip()
+                if "company:" in line_lower:
+                    company = line.split(":", 1)[-1].strip()
 
         return title, company, location
 
@@ -270,9 +358,7 @@ class JobRequirementsExtractor:
         if not text or len(text) < 3 or len(text) > 80:
             return False
 
-        text_lower = text.lower()
-        has_title_word = any(kw in text_lower for kw in self.TITLE_KEYWORDS)
-        return has_title_word
+        return self._TITLE_RE.search(text) is not None
 
     def _extract_skills_from_section(self, section_text: str) -> List[str]:
         """
@@ -317,34 +403,16 @@ class JobRequirementsExtractor:
         if not text:
             return 0.0
 
-        patterns = [
-            # "at least X years" / "minimum X years"
-            r'(?:at\s+least|minimum|min\.?)\s+(\d+\.?\d*)\s*\+?\s*years?',
-            # "X+ years of experience"
-            r'(\d+\.?\d*)\s*\+\s*years?\s+of\s+(?:\w+\s+)?experience',
-            # "X years of experience"
-            r'(\d+\.?\d*)\s+years?\s+of\s+(?:\w+\s+)?experience',
-            # "X-Y years" → take X (lower bound)
-            r'(\d+)\s*[-–]\s*\d+\s*years?',
-            # "X to Y years" → take X (lower bound)
-            r'(\d+)\s+to\s+\d+\s*years?',
-            # "X years working / in"
-            r'(\d+\.?\d*)\s*\+?\s*years?\s+(?:working|in|as)',
-        ]
-
-        found = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    years = float(match)
-                    if 0 < years <= 30:  # Sanity check
-                        found.append(years)
-                except ValueError:
-                    continue
+        # One sweep; track the running minimum (most lenient /
+        # entry-level requirement) in a scalar instead of a list
+        minimum = 0.0
+        for m in self._EXPERIENCE_RE.finditer(text):
+            years = float(m.group(m.lastgroup))
+            if 0 < years <= 30:  # Sanity check
+                if minimum == 0.0 or years < minimum:
+                    minimum = years
 
-        # Return minimum found (most lenient / entry-level requirement)
-        return min(found) if found else 0.0
+        return minimum
 
     def _extract_education_requirement(self, text: str) -> str:
         """
@@ -362,26 +430,29 @@ class JobRequirementsExtractor:
         if not text:
             return ""
 
-        lines = text.splitlines()
-        education_lines = []
-
-        for line in lines:
-            line_stripped = line.strip()
-            line_lower = line_stripped.lower()
-
-            # Check if line contains any degree keyword
-            has_degree = any(kw in line_lower for kw in self.DEGREE_KEYWORDS)
+        # One finditer sweep over the whole section instead of a
+        # search per line — only lines that actually contain a degree
+        # keyword are sliced out and cleaned, the rest are never
+        # touched. Matches map back to their line via the surrounding
+        # newlines; a line with several keywords is handled once.
+        best = ""
+        last_start = -1
+        for m in self._DEGREE_RE.finditer(text):
+            start = text.rfind("\n", 0, m.start()) + 1
+            if start == last_start:
+                continue
+            last_start = start
 
-            if has_degree and len(line_stripped) > 5:
-                # Clean up bullet points and leading symbols
-                cleaned = re.sub(r'^[\-\*\•\–\·\s]+', '', line_stripped)
-                if cleaned:
-                    education_lines.append(cleaned)
+            end = text.find("\n", m.end())
+            if end == -1:
+                end = len(text)
 
-        if not education_lines:
-            return ""
+            line_stripped = text[start:end].strip()
+            if len(line_stripped) > 5:
+                # Clean up bullet points and leading symbols; keep the
+                # most informative (longest) line
+                cleaned = self._BULLET_RE.sub('', line_stripped)
+                if len(cleaned) > len(best):
+                    best = cleaned
 
-        # Return the most informative line
-        # (longest line tends to be most descriptive)
-        best = max(education_lines, key=len)
         return best
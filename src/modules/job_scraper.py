@@ -1,25 +1,62 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
+import asyncio
 import hashlib
 import json
+import sqlite3
 import threading
 
 import numpy as np
 
+import httpx
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+# HTTP/2 multiplexing lets all pages of a query share one TLS/TCP
+# connection, but httpx needs the optional h2 package for it
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# C-implemented JSON serializer. Stdlib json stays as the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Selenium is optional; we import it, but we only start a driver if/when needed.
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 
-
-@dataclass
+# lxml parses an Indeed results page an order of magnitude faster than
+# the pure-Python html.parser; fall back gracefully where it isn't
+# installed. SoupStrainer only works with html.parser, so the fallback
+# path at least restricts parsing to the job-card subtrees.
+try:
+    import lxml  # noqa: F401
+    _SOUP_PARSER = "lxml"
+    _CARD_STRAINER = None
+except ImportError:
+    _SOUP_PARSER = "html.parser"
+    _CARD_STRAINER = SoupStrainer(
+        ["a", "div"], class_=["tapItem", "job_seen_beacon"]
+    )
+
+
+@dataclass(slots=True)
 class JobPosting:
-    """Structured representation of a single job posting scraped from a site."""
+    """Structured representation of a single job posting scraped from a site.
+
+    slots=True: a scrape run holds thousands of these, and slots drop
+    the per-instance __dict__ while making field access a fixed-offset
+    load instead of a dict lookup.
+    """
 
     title: str
     company: str
@@ -31,17 +68,31 @@ class JobPosting:
     source: str = ""  # "indeed", "linkedin", "glassdoor", etc.
 
     # Optional / computed fields
-    embedding: Optional[np.ndarray] = None  # Later: job description embedding
-    hash_id: Optional[str] = None  # For deduplication
+    embedding_idx: Optional[int] = None  # Row in JobScraper.embeddings
+    hash_id: Optional[bytes] = None  # 16-byte digest for deduplication
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))  # When scraped
 
 
 class JobScraper:
-    def __init__(self, enable_selenium: bool = True) -> None:
+    # Dimensionality of the job-description embeddings (MiniLM)
+    EMBEDDING_DIM = 384
+
+    # New hashes are written to the dedupe DB in batches of this size
+    _DEDUPE_FLUSH_BATCH = 500
+
+    def __init__(self, enable_selenium: bool = True, dedupe_db_path: Optional[str] = None) -> None:
         """Initialize HTTP session + dedupe structures.
 
         Selenium is expensive and sometimes fails on machines without a working
         Chrome/Chromedriver setup. So we lazy-init the driver only when needed.
+
+        Args:
+            enable_selenium: Allow lazy creation of a Chrome driver.
+            dedupe_db_path:  Optional path to a SQLite file that
+                             persists seen-job hashes across runs, so a
+                             restart doesn't re-collect everything. The
+                             in-memory set stays the fast path; new
+                             hashes are flushed in batches.
         """
 
         # Reusable HTTP session for sites that do not require JS.
@@ -57,12 +108,37 @@ class JobScraper:
         )
 
         # Deduplication set (stores hash_ids of already-seen jobs).
-        self.seen_job_hashes: set[str] = set()
+        self.seen_job_hashes: set[bytes] = set()
+
+        # Optional persistent dedupe store, same SQLite-cache pattern
+        # as the embeddings cache. The whole table warms the in-memory
+        # set once at startup; _dedupe itself never touches the DB.
+        self._dedupe_db = None
+        self._pending_hashes: List[bytes] = []
+        if dedupe_db_path:
+            self._dedupe_db = sqlite3.connect(dedupe_db_path, check_same_thread=False)
+            self._dedupe_db.execute(
+                "CREATE TABLE IF NOT EXISTS seen (h BLOB PRIMARY KEY)"
+            )
+            self._dedupe_db.commit()
+            self.seen_job_hashes.update(
+                row[0] for row in self._dedupe_db.execute("SELECT h FROM seen")
+            )
 
-        # Selenium-related state.
+        # Embeddings in structure-of-arrays form: one float16 row per
+        # job instead of an np.ndarray object hanging off each posting.
+        # Postings carry only their row index; downstream similarity
+        # gets the whole corpus as a single contiguous matrix.
+        self._embedding_rows: List[np.ndarray] = []
+        self._embeddings_cache: Optional[np.ndarray] = None
+
+        # Selenium-related state. One driver per worker thread via
+        # thread-local storage — a shared driver would force every
+        # Selenium scrape through a lock, serializing the executor.
         self._enable_selenium = enable_selenium
-        self._driver: Optional[webdriver.Chrome] = None
-        self._driver_lock = threading.Lock()
+        self._tls = threading.local()
+        self._all_drivers: List[webdriver.Chrome] = []
+        self._all_drivers_lock = threading.Lock()
 
         print("✓ JobScraper initialized (session + dedupe set)")
 
@@ -71,42 +147,52 @@ class JobScraper:
     # -------------------------
 
     def _get_driver(self) -> webdriver.Chrome:
-        """Lazy-create and return a Selenium Chrome driver."""
+        """Lazy-create and return this thread's Selenium Chrome driver.
+
+        Each worker thread gets its own driver (Chrome's DevTools
+        protocol is cheap per process), so Selenium scrapes can run
+        in parallel without sharing a session. Every created driver
+        is also tracked in _all_drivers so close() can quit them all.
+        """
         if not self._enable_selenium:
             raise RuntimeError(
                 "Selenium is disabled (enable_selenium=False). "
                 "You called a Selenium-based scraper method."
             )
 
-        if self._driver is None:
+        driver = getattr(self._tls, "driver", None)
+        if driver is None:
             chrome_options = Options()
             chrome_options.add_argument("--headless=new")
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument("--disable-dev-shm-usage")
-            self._driver = webdriver.Chrome(options=chrome_options)
+            driver = webdriver.Chrome(options=chrome_options)
+            self._tls.driver = driver
+            with self._all_drivers_lock:
+                self._all_drivers.append(driver)
             print("✓ Selenium driver initialized")
 
-        return self._driver
+        return driver
 
     @staticmethod
     def _normalize_text(text: str) -> str:
-        return " ".join((text or "").split()).strip().lower()
+        # split() already trims both ends, so the old trailing .strip()
+        # was a third pass over the string for nothing
+        return " ".join((text or "").split()).lower()
 
-    def _compute_hash_id(self, source: str, url: str, title: str, company: str, location: str) -> str:
+    def _compute_hash_id(self, source: str, url: str, title: str, company: str, location: str) -> bytes:
         """Compute a stable hash for deduplication.
 
         We prefer URL, but fall back to other fields if URL is missing.
+
+        Raw 16-byte blake2b digest rather than a 64-char SHA-256 hex
+        string: a quarter of the memory per entry in seen_job_hashes,
+        cheaper set membership (one hash + short memcmp), and blake2b
+        is single-block for inputs this size.
         """
-        base = "|".join(
-            [
-                self._normalize_text(source),
-                self._normalize_text(url),
-                self._normalize_text(title),
-                self._normalize_text(company),
-                self._normalize_text(location),
-            ]
-        )
-        return hashlib.sha256(base.encode("utf-8")).hexdigest()
+        norm = self._normalize_text
+        base = "|".join((norm(source), norm(url), norm(title), norm(company), norm(location)))
+        return hashlib.blake2b(base.encode("utf-8"), digest_size=16).digest()
 
     def _dedupe(self, job: JobPosting) -> bool:
         """Return True if job is new, False if it was already seen."""
@@ -117,97 +203,217 @@ class JobScraper:
             return False
 
         self.seen_job_hashes.add(job.hash_id)
+
+        if self._dedupe_db is not None:
+            self._pending_hashes.append(job.hash_id)
+            if len(self._pending_hashes) >= self._DEDUPE_FLUSH_BATCH:
+                self._flush_seen_hashes()
+
         return True
 
+    def _flush_seen_hashes(self) -> None:
+        """Write buffered new hashes to the dedupe DB in one batch."""
+        if self._dedupe_db is None or not self._pending_hashes:
+            return
+        self._dedupe_db.executemany(
+            "INSERT OR IGNORE INTO seen (h) VALUES (?)",
+            [(h,) for h in self._pending_hashes],
+        )
+        self._dedupe_db.commit()
+        self._pending_hashes.clear()
+
+    def add_embedding(self, job: JobPosting, vector: np.ndarray) -> int:
+        """Store a job's embedding as a float16 matrix row.
+
+        The posting keeps only the row index, so 10k postings cost one
+        (N, 384) float16 matrix instead of 10k fragmented FP32 arrays.
+        """
+        self._embedding_rows.append(np.asarray(vector, dtype=np.float16))
+        self._embeddings_cache = None
+        job.embedding_idx = len(self._embedding_rows) - 1
+        return job.embedding_idx
+
+    def get_embedding(self, job: JobPosting) -> Optional[np.ndarray]:
+        """Return the stored embedding row for a posting, if any."""
+        if job.embedding_idx is None:
+            return None
+        return self._embedding_rows[job.embedding_idx]
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        """All stored embeddings as one contiguous (N, 384) float16 matrix."""
+        if self._embeddings_cache is None:
+            if self._embedding_rows:
+                self._embeddings_cache = np.vstack(self._embedding_rows)
+            else:
+                self._embeddings_cache = np.empty(
+                    (0, self.EMBEDDING_DIM), dtype=np.float16
+                )
+        return self._embeddings_cache
+
     def close(self) -> None:
-        """Close Selenium driver if it was created."""
-        if self._driver is not None:
+        """Flush pending dedupe hashes and close Selenium if created."""
+        if self._dedupe_db is not None:
+            self._flush_seen_hashes()
+            self._dedupe_db.close()
+            self._dedupe_db = None
+
+        with self._all_drivers_lock:
+            drivers, self._all_drivers = self._all_drivers, []
+        for driver in drivers:
             try:
-                self._driver.quit()
-            finally:
-                self._driver = None
+                driver.quit()
+            except Exception:
+                continue
 
     # -------------------------
     # Scrapers
     # -------------------------
 
+    def _make_async_client(self) -> httpx.AsyncClient:
+        """Configure an httpx client for page fetching.
+
+        Keepalive connections (and HTTP/2 where h2 is installed) let
+        every page of every query reuse the same TLS/TCP sessions.
+        """
+        return httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            headers=dict(self.session.headers),
+            limits=httpx.Limits(max_keepalive_connections=32),
+            follow_redirects=True,
+        )
+
     def scrape_indeed(self, query: str, location: str = "Remote", pages: int = 5) -> List[JobPosting]:
-        """Scrape Indeed search results with requests + BeautifulSoup.
+        """Scrape Indeed search results (sync wrapper around the async path).
 
         Note: Indeed markup changes frequently. This implementation is intentionally
         conservative: it tries to extract a basic list of job cards, and if it can’t,
         it will safely return an empty list (but without crashing your pipeline).
         """
-
-        jobs: List[JobPosting] = []
-
-        for page in range(pages):
-            # Indeed typically uses a start offset for pagination.
-            start = page * 10
-
-            # Basic search URL pattern.
-            url = (
-                "https://www.indeed.com/jobs?"
-                f"q={requests.utils.quote(query)}&"
-                f"l={requests.utils.quote(location)}&"
-                f"start={start}"
+        return asyncio.run(self.scrape_indeed_async(query, location=location, pages=pages))
+
+    async def scrape_indeed_async(
+        self,
+        query: str,
+        location: str = "Remote",
+        pages: int = 5,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> List[JobPosting]:
+        """Fetch all result pages of one query concurrently.
+
+        Pagination is network-bound (~200-800ms per page), so the pages
+        are issued through one asyncio.gather over a shared keepalive
+        client instead of sequential blocking gets. Pass an existing
+        client when batching multiple queries in one event loop.
+        """
+        urls = [
+            "https://www.indeed.com/jobs?"
+            f"q={requests.utils.quote(query)}&"
+            f"l={requests.utils.quote(location)}&"
+            f"start={page * 10}"
+            for page in range(pages)
+        ]
+
+        owns_client = client is None
+        if owns_client:
+            client = self._make_async_client()
+
+        try:
+            responses = await asyncio.gather(
+                *(client.get(url, timeout=20) for url in urls),
+                return_exceptions=True,
             )
+        finally:
+            if owns_client:
+                await client.aclose()
 
+        jobs: List[JobPosting] = []
+        for resp in responses:
+            # Don’t crash the whole run if a request fails.
+            if isinstance(resp, BaseException):
+                continue
             try:
-                resp = self.session.get(url, timeout=20)
                 resp.raise_for_status()
             except Exception:
-                # Don’t crash the whole run if a request fails.
                 continue
 
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            # Indeed job cards have varied. We try a few common selectors.
-            cards = soup.select("a.tapItem")
-            if not cards:
-                cards = soup.select("div.job_seen_beacon")
-
-            for card in cards:
-                # Attempt to extract a link.
-                link_tag = card if card.name == "a" else card.select_one("a")
-                href = link_tag.get("href") if link_tag else None
-                job_url = ""
-                if href:
-                    job_url = href if href.startswith("http") else f"https://www.indeed.com{href}"
-
-                # Attempt to extract title/company/location.
-                title = ""
-                title_tag = card.select_one("h2.jobTitle") or card.select_one("span[title]")
-                if title_tag:
-                    title = title_tag.get_text(strip=True)
-
-                company = ""
-                company_tag = card.select_one("span.companyName")
-                if company_tag:
-                    company = company_tag.get_text(strip=True)
-
-                loc = location
-                loc_tag = card.select_one("div.companyLocation")
-                if loc_tag:
-                    loc = loc_tag.get_text(strip=True)
-
-                if not title and not job_url:
-                    continue
+            jobs.extend(self._parse_indeed_page(resp.text, location))
 
-                job = JobPosting(
-                    title=title or "(unknown title)",
-                    company=company or "(unknown company)",
-                    location=loc or "(unknown location)",
-                    job_type="",  # You can fill this later
-                    description="",  # You can fetch detail pages later
-                    requirements=[],
-                    url=job_url,
-                    source="indeed",
-                )
+        return jobs
+
+    @staticmethod
+    def _extract_card_fields(card) -> tuple:
+        """Pull href/title/company/location from one card in a single walk.
+
+        Four select_one() calls each re-traverse the whole card
+        subtree; one pass over card.descendants finds all four fields
+        with a quarter of the tree walks. First match wins for each
+        field, matching select_one semantics (an h2.jobTitle anywhere
+        still beats a span[title] fallback seen earlier).
+        """
+        href = card.get("href") if card.name == "a" else None
+        title_h2 = title_span = company = loc_text = None
+
+        for tag in card.descendants:
+            name = getattr(tag, "name", None)
+            if name is None:
+                continue
+            classes = tag.get("class") or ()
+            if href is None and name == "a":
+                href = tag.get("href")
+            elif title_h2 is None and name == "h2" and "jobTitle" in classes:
+                title_h2 = tag.get_text(strip=True)
+            elif name == "span":
+                if title_span is None and tag.get("title") is not None:
+                    title_span = tag.get_text(strip=True)
+                if company is None and "companyName" in classes:
+                    company = tag.get_text(strip=True)
+            elif loc_text is None and name == "div" and "companyLocation" in classes:
+                loc_text = tag.get_text(strip=True)
+
+            if href and title_h2 and company and loc_text:
+                break
+
+        title = title_h2 if title_h2 is not None else title_span
+        return href, title or "", company or "", loc_text or ""
+
+    def _parse_indeed_page(self, html: str, location: str) -> List[JobPosting]:
+        """Extract deduplicated job postings from one results page."""
+        jobs: List[JobPosting] = []
+
+        soup = BeautifulSoup(html, _SOUP_PARSER, parse_only=_CARD_STRAINER)
+
+        # Indeed job cards have varied. We try a few common selectors.
+        cards = soup.select("a.tapItem")
+        if not cards:
+            cards = soup.select("div.job_seen_beacon")
+
+        for card in cards:
+            href, title, company, loc_text = self._extract_card_fields(card)
+
+            job_url = ""
+            if href:
+                job_url = href if href.startswith("http") else f"https://www.indeed.com{href}"
+
+            loc = loc_text or location
 
-                job.hash_id = self._compute_hash_id(job.source, job.url, job.title, job.company, job.location)
-                if self._dedupe(job):
-                    jobs.append(job)
+            if not title and not job_url:
+                continue
+
+            job = JobPosting(
+                title=title or "(unknown title)",
+                company=company or "(unknown company)",
+                location=loc or "(unknown location)",
+                job_type="",  # You can fill this later
+                description="",  # You can fetch detail pages later
+                requirements=[],
+                url=job_url,
+                source="indeed",
+            )
+
+            job.hash_id = self._compute_hash_id(job.source, job.url, job.title, job.company, job.location)
+            if self._dedupe(job):
+                jobs.append(job)
 
         return jobs
 
@@ -233,47 +439,62 @@ class JobScraper:
         """Scrape multiple sources and multiple queries.
 
         Important note:
-        - requests-based scrapers are safe to run in threads.
-        - selenium-based scrapers are NOT thread-safe with a shared driver.
+        - HTTP-based scrapers all share one async client/event loop.
+        - Selenium scrapers run on an executor; each worker thread
+          lazily gets its own driver via _get_driver().
 
-        This implementation parallelizes Indeed (requests) and runs Selenium scrapers
-        sequentially (currently they are placeholders anyway).
+        This implementation gathers every page of every Indeed query in a
+        single event loop over one keepalive client, and fans Selenium
+        scrapes (currently placeholders) out across worker threads.
         """
 
         all_jobs: List[JobPosting] = []
 
-        # 1) Parallelize requests-based scraping (Indeed)
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
-        def _run(fn: Callable[..., List[JobPosting]], q: str) -> List[JobPosting]:
-            return fn(q, location=location)
+        # 1) All Indeed queries concurrently on one client
+        async def _scrape_http_sources() -> list:
+            client = self._make_async_client()
+            try:
+                return await asyncio.gather(
+                    *(
+                        self.scrape_indeed_async(q, location=location, client=client)
+                        for q in queries
+                    ),
+                    return_exceptions=True,
+                )
+            finally:
+                await client.aclose()
 
-        with ThreadPoolExecutor(max_workers=min(8, max(1, len(queries)))) as ex:
-            futures = [ex.submit(_run, self.scrape_indeed, q) for q in queries]
-            for fut in as_completed(futures):
+        for result in asyncio.run(_scrape_http_sources()):
+            # Keep going even if one task fails.
+            if isinstance(result, BaseException):
+                continue
+            all_jobs.extend(result)
+
+        # 2) Selenium scrapers (parallel) - placeholders for now.
+        # Thread-local drivers make these safe to run concurrently;
+        # no lock needed.
+        def _scrape_selenium_sources(q: str) -> List[JobPosting]:
+            jobs: List[JobPosting] = []
+            jobs.extend(self.scrape_linkedin(q, location=location))
+            jobs.extend(self.scrape_glassdoor(q, location=location))
+            return jobs
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(_scrape_selenium_sources, q) for q in queries]
+            for future in futures:
                 try:
-                    all_jobs.extend(fut.result())
+                    all_jobs.extend(future.result())
                 except Exception:
-                    # Keep going even if one task fails.
                     continue
 
-        # 2) Selenium scrapers (sequential, guarded) - placeholders for now
-        # If you later implement them, either create one driver per thread or keep sequential.
-        for q in queries:
-            try:
-                # Guard any future selenium usage with a lock.
-                with self._driver_lock:
-                    all_jobs.extend(self.scrape_linkedin(q, location=location))
-                    all_jobs.extend(self.scrape_glassdoor(q, location=location))
-            except Exception:
-                continue
-
         return all_jobs
 
     def save_jobs_to_json(self, jobs: List[JobPosting], output_file: str) -> None:
         """Serialize a list of JobPosting objects to JSON.
 
-        Handles numpy arrays and datetimes safely.
+        Handles datetimes safely. If embeddings were stored, the
+        float16 matrix is written once to '<output_file>.embeddings.npy'
+        and each posting's JSON carries only its row index.
         """
 
         def to_jsonable(job: JobPosting) -> Dict[str, Any]:
@@ -286,21 +507,29 @@ class JobScraper:
                 "requirements": list(job.requirements or []),
                 "url": job.url,
                 "source": job.source,
-                "hash_id": job.hash_id,
+                "hash_id": job.hash_id.hex() if job.hash_id else None,
                 "created_at": job.created_at.isoformat() if isinstance(job.created_at, datetime) else None,
             }
 
-            if job.embedding is not None:
-                # Convert numpy array to list for JSON.
-                d["embedding"] = job.embedding.tolist()
-            else:
-                d["embedding"] = None
+            d["embedding_idx"] = job.embedding_idx
 
             return d
 
         payload = [to_jsonable(j) for j in jobs]
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+
+        # The embedding matrix goes to one binary sidecar instead of
+        # per-row float lists inside the JSON
+        if self._embedding_rows:
+            np.save(output_file + ".embeddings.npy", self.embeddings)
+        if orjson is not None:
+            with open(output_file, "wb") as f:
+                f.write(orjson.dumps(
+                    payload,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                ))
+        else:
+            with open(output_file, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2)
 
 
 # Optional convenience for local testing
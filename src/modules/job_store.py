@@ -76,6 +76,54 @@ CREATE TABLE IF NOT EXISTS jobs (
 )
 """
 
+# SQL hoisted to module scope: built once at import instead of
+# re-allocating the statement string on every call
+_INSERT_JOB_SQL = """
+    INSERT OR IGNORE INTO jobs (
+        job_id, title, company, location, url, source,
+        match_score, matched_skills, missing_skills, rank_label,
+        status, last_updated, found_date, date_posted
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Same insert without conflict resolution, for the pre-deduped
+# bulk path (bulk_save_new)
+_INSERT_JOB_NEW_SQL = _INSERT_JOB_SQL.replace("INSERT OR IGNORE", "INSERT")
+
+_UPDATE_STATUS_SQL = """
+    UPDATE jobs
+    SET status = ?, last_updated = ?
+    WHERE job_id = ?
+"""
+
+_UPDATE_STATUS_APPLIED_SQL = """
+    UPDATE jobs
+    SET status = ?, last_updated = ?, applied_date = ?
+    WHERE job_id = ?
+"""
+
+_UPDATE_NOTES_SQL = "UPDATE jobs SET notes = ?, last_updated = ? WHERE job_id = ?"
+
+_DELETE_SQL = "DELETE FROM jobs WHERE job_id = ?"
+
+_GET_JOB_SQL = "SELECT * FROM jobs WHERE job_id = ?"
+
+_SKILL_COUNTS_SQL = """
+    SELECT json_array_length(matched_skills),
+           json_array_length(missing_skills)
+    FROM jobs WHERE job_id = ?
+"""
+
+_STATUS_COUNTS_SQL = "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+
+_SCORE_STATS_SQL = "SELECT COUNT(*), MAX(match_score), AVG(match_score) FROM jobs"
+
+
+def _now() -> tuple:
+    """Return (timestamp, date) strings from one clock read."""
+    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return ts, ts[:10]
+
 
 class JobStore:
     """
@@ -97,16 +145,27 @@ class JobStore:
         store.close()
     """
 
-    def __init__(self, db_path: str = "data/jobs.db"):
+    def __init__(self, db_path: str = "data/jobs.db", tune: bool = True):
+        """
+        Args:
+            db_path: SQLite database file, or ":memory:" for tests.
+            tune:    Apply the PRAGMA performance tuning at connect
+                     time (WAL, relaxed fsync). Pass False to keep
+                     SQLite's defaults (the --no-db-tune CLI flag).
+        """
         self.db_path = db_path
 
         if db_path != ":memory:":
             Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
         # Single persistent connection — required for :memory: correctness
-        self._conn             = sqlite3.connect(db_path)
+        self._conn = sqlite3.connect(
+            db_path, check_same_thread=False, cached_statements=256
+        )
         self._conn.row_factory = sqlite3.Row
 
+        if tune:
+            self.tune_for_performance()
         self._init_db()
         logger.info(f"JobStore ready: {db_path}")
 
@@ -114,6 +173,32 @@ class JobStore:
     # CONNECTION
     # ------------------------------------------------------------------
 
+    def tune_for_performance(self):
+        """
+        Apply SQLite PRAGMA tuning for production workloads.
+
+        WAL journaling plus relaxed synchronous mode cuts fsyncs per
+        commit dramatically and lets readers run concurrently with the
+        pipeline's inserts. Called at connect time unless the store
+        was created with tune=False; safe to call again. :memory:
+        databases skip the WAL pragmas (WAL needs a shared-memory
+        file) but keep the cache settings.
+        """
+        if self.db_path != ":memory:":
+            self._conn.executescript("""
+                PRAGMA journal_mode       = WAL;
+                PRAGMA synchronous        = NORMAL;
+                PRAGMA wal_autocheckpoint = 1000;
+                PRAGMA journal_size_limit = 67108864;
+            """)
+        self._conn.executescript("""
+            PRAGMA temp_store   = MEMORY;
+            PRAGMA cache_size   = -65536;
+            PRAGMA mmap_size    = 268435456;
+            PRAGMA busy_timeout = 5000;
+        """)
+        logger.info("JobStore PRAGMA tuning applied (WAL, synchronous=NORMAL)")
+
     def close(self):
         """Close the database connection."""
         if self._conn:
@@ -130,28 +215,102 @@ class JobStore:
         Save a matched job to the database.
 
         Silently skips duplicates (same job_id already exists).
+        One-element wrapper over save_jobs() — use the batch API
+        when saving a whole scrape run.
 
         Returns:
             True  if the job was newly inserted
             False if it was already in the database (duplicate)
         """
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        inserted = self.save_jobs([(scraped_job, ranking_result)]) == 1
+
+        if inserted:
+            logger.debug(
+                f"Saved: {scraped_job.raw_title} @ {scraped_job.company} "
+                f"(score={ranking_result.overall_score:.3f})"
+            )
+        else:
+            logger.debug(f"Duplicate skipped: {scraped_job.job_id}")
+
+        return inserted
+
+    def save_jobs(self, pairs) -> int:
+        """
+        Save many matched jobs in one transaction.
+
+        Each commit is an fsync, so inserting N jobs one save_job()
+        at a time costs N fsyncs; one BEGIN/COMMIT around a single
+        executemany() costs one. Duplicates are skipped per row, same
+        as save_job().
+
+        Args:
+            pairs: Iterable of (scraped_job, ranking_result) tuples.
+
+        Returns:
+            Number of newly inserted rows (duplicates excluded).
+        """
+        now, _ = _now()
+        rows   = [self._job_params(s, r, now) for s, r in pairs]
+        if not rows:
+            return 0
+
+        with self._conn:
+            cur = self._conn.executemany(_INSERT_JOB_SQL, rows)
+
+        inserted = max(cur.rowcount, 0)
+        logger.debug(f"Batch save: {inserted}/{len(rows)} new")
+        return inserted
+
+    def bulk_save_new(self, pairs) -> int:
+        """
+        Bulk-insert for fresh-scrape rebuilds.
+
+        Duplicates are filtered against the existing job_ids (and
+        within the batch) in Python first, so the insert itself can
+        be a plain INSERT — SQLite skips the per-row conflict
+        resolution that INSERT OR IGNORE pays. Prefer save_jobs()
+        when another writer could insert the same ids concurrently.
+
+        Args:
+            pairs: Iterable of (scraped_job, ranking_result) tuples.
+
+        Returns:
+            Number of rows inserted.
+        """
+        now, _   = _now()
+        existing = {
+            r[0] for r in self._conn.execute("SELECT job_id FROM jobs")
+        }
 
+        rows = []
+        for scraped_job, ranking_result in pairs:
+            if scraped_job.job_id in existing:
+                continue
+            existing.add(scraped_job.job_id)
+            rows.append(self._job_params(scraped_job, ranking_result, now))
+
+        if not rows:
+            return 0
+
+        with self._conn:
+            self._conn.executemany(_INSERT_JOB_NEW_SQL, rows)
+
+        logger.debug(f"Bulk save: {len(rows)} new rows")
+        return len(rows)
+
+    @staticmethod
+    def _job_params(scraped_job, ranking_result, now: str) -> tuple:
+        """Build the INSERT parameter tuple for one job."""
+        # Compact separators and raw UTF-8 shrink the stored payload
         matched = json.dumps(
-            getattr(ranking_result.match_result, "matched_skills", [])
+            getattr(ranking_result.match_result, "matched_skills", []),
+            separators=(",", ":"), ensure_ascii=False,
         )
         missing = json.dumps(
-            getattr(ranking_result.match_result, "missing_skills", [])
+            getattr(ranking_result.match_result, "missing_skills", []),
+            separators=(",", ":"), ensure_ascii=False,
         )
-
-        sql = """
-            INSERT OR IGNORE INTO jobs (
-                job_id, title, company, location, url, source,
-                match_score, matched_skills, missing_skills, rank_label,
-                status, last_updated, found_date, date_posted
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        params = (
+        return (
             scraped_job.job_id,
             scraped_job.raw_title,
             scraped_job.company,
@@ -168,20 +327,6 @@ class JobStore:
             scraped_job.date_posted,
         )
 
-        cur = self._conn.execute(sql, params)
-        self._conn.commit()
-        inserted = cur.rowcount > 0
-
-        if inserted:
-            logger.debug(
-                f"Saved: {scraped_job.raw_title} @ {scraped_job.company} "
-                f"(score={ranking_result.overall_score:.3f})"
-            )
-        else:
-            logger.debug(f"Duplicate skipped: {scraped_job.job_id}")
-
-        return inserted
-
     def update_status(self, job_id: str, status: str) -> bool:
         """
         Update the application status of a job.
@@ -198,21 +343,13 @@ class JobStore:
                 f"Valid: {sorted(APPLICATION_STATUSES)}"
             )
 
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        now, today = _now()
 
         if status == "APPLIED":
-            sql    = """
-                UPDATE jobs
-                SET status = ?, last_updated = ?, applied_date = ?
-                WHERE job_id = ?
-            """
-            params = (status, now, now[:10], job_id)
+            sql    = _UPDATE_STATUS_APPLIED_SQL
+            params = (status, now, today, job_id)
         else:
-            sql    = """
-                UPDATE jobs
-                SET status = ?, last_updated = ?
-                WHERE job_id = ?
-            """
+            sql    = _UPDATE_STATUS_SQL
             params = (status, now, job_id)
 
         cur     = self._conn.execute(sql, params)
@@ -228,19 +365,16 @@ class JobStore:
 
     def add_note(self, job_id: str, note: str) -> bool:
         """Save a free-text note for a job (replaces existing note)."""
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        now, _ = _now()
         cur = self._conn.execute(
-            "UPDATE jobs SET notes = ?, last_updated = ? WHERE job_id = ?",
-            (note.strip(), now, job_id),
+            _UPDATE_NOTES_SQL, (note.strip(), now, job_id)
         )
         self._conn.commit()
         return cur.rowcount > 0
 
     def delete_job(self, job_id: str) -> bool:
         """Permanently delete a job record."""
-        cur = self._conn.execute(
-            "DELETE FROM jobs WHERE job_id = ?", (job_id,)
-        )
+        cur = self._conn.execute(_DELETE_SQL, (job_id,))
         self._conn.commit()
         return cur.rowcount > 0
 
@@ -253,6 +387,9 @@ class JobStore:
         status_filter: Optional[List[str]] = None,
         min_score:     float               = 0.0,
         order_by:      str                 = "match_score DESC",
+        limit:         Optional[int]       = None,
+        offset:        int                 = 0,
+        columns:       Optional[List[str]] = None,
     ) -> List[Dict]:
         """
         Fetch jobs from the database.
@@ -262,10 +399,19 @@ class JobStore:
                            None = return all statuses.
             min_score:     Only return jobs with match_score >= value.
             order_by:      SQL ORDER BY clause.
+            limit:         Max rows to return. None = all rows.
+                           With idx_jobs_status_score this turns a
+                           full-table materialization into a bounded
+                           index scan — the TUI only shows one
+                           screenful at a time.
+            offset:        Rows to skip (pagination; used with limit).
+            columns:       Column names to fetch. None = all columns.
+                           Skipping matched_skills/missing_skills also
+                           skips their per-row JSON parsing.
 
         Returns:
             List of dicts. matched_skills and missing_skills are
-            Python lists (not JSON strings).
+            Python lists (not JSON strings) when fetched.
         """
         conditions = ["match_score >= ?"]
         params     = [min_score]
@@ -275,17 +421,20 @@ class JobStore:
             conditions.append(f"status IN ({placeholders})")
             params.extend(status_filter)
 
-        where = " AND ".join(conditions)
-        sql   = f"SELECT * FROM jobs WHERE {where} ORDER BY {order_by}"
+        select = ", ".join(columns) if columns else "*"
+        where  = " AND ".join(conditions)
+        sql    = f"SELECT {select} FROM jobs WHERE {where} ORDER BY {order_by}"
+
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend((limit, offset))
 
         rows = self._conn.execute(sql, params).fetchall()
         return [self._row_to_dict(row) for row in rows]
 
     def get_job(self, job_id: str) -> Optional[Dict]:
         """Fetch a single job by job_id. Returns None if not found."""
-        row = self._conn.execute(
-            "SELECT * FROM jobs WHERE job_id = ?", (job_id,)
-        ).fetchone()
+        row = self._conn.execute(_GET_JOB_SQL, (job_id,)).fetchone()
         return self._row_to_dict(row) if row else None
 
     def get_stats(self) -> Dict:
@@ -297,41 +446,34 @@ class JobStore:
             offer_received, rejected, declined,
             best_score, mean_score
         """
-        sql = """
-            SELECT
-                COUNT(*)                                                  AS total,
-                SUM(CASE WHEN status='NOT_APPLIED'    THEN 1 ELSE 0 END) AS not_applied,
-                SUM(CASE WHEN status='APPLIED'        THEN 1 ELSE 0 END) AS applied,
-                SUM(CASE WHEN status='INTERVIEWING'   THEN 1 ELSE 0 END) AS interviewing,
-                SUM(CASE WHEN status='OFFER_RECEIVED' THEN 1 ELSE 0 END) AS offer_received,
-                SUM(CASE WHEN status='REJECTED'       THEN 1 ELSE 0 END) AS rejected,
-                SUM(CASE WHEN status='DECLINED'       THEN 1 ELSE 0 END) AS declined,
-                MAX(match_score)                                          AS best_score,
-                AVG(match_score)                                          AS mean_score
-            FROM jobs
-        """
-        row = self._conn.execute(sql).fetchone()
-
-        if not row or row["total"] == 0:
-            return {
-                "total": 0, "not_applied": 0, "applied": 0,
-                "interviewing": 0, "offer_received": 0,
-                "rejected": 0, "declined": 0,
-                "best_score": 0.0, "mean_score": 0.0,
-            }
+        # GROUP BY does one comparison per row (vs seven SUM(CASE)
+        # branches) and with idx_jobs_status it is an index-only scan
+        counts = dict(self._conn.execute(_STATUS_COUNTS_SQL).fetchall())
+        total, best, mean = self._conn.execute(_SCORE_STATS_SQL).fetchone()
 
         return {
-            "total":          row["total"]          or 0,
-            "not_applied":    row["not_applied"]     or 0,
-            "applied":        row["applied"]         or 0,
-            "interviewing":   row["interviewing"]    or 0,
-            "offer_received": row["offer_received"]  or 0,
-            "rejected":       row["rejected"]        or 0,
-            "declined":       row["declined"]        or 0,
-            "best_score":     round(row["best_score"] or 0.0, 4),
-            "mean_score":     round(row["mean_score"] or 0.0, 4),
+            "total":          total or 0,
+            "not_applied":    counts.get("NOT_APPLIED", 0),
+            "applied":        counts.get("APPLIED", 0),
+            "interviewing":   counts.get("INTERVIEWING", 0),
+            "offer_received": counts.get("OFFER_RECEIVED", 0),
+            "rejected":       counts.get("REJECTED", 0),
+            "declined":       counts.get("DECLINED", 0),
+            "best_score":     round(best or 0.0, 4),
+            "mean_score":     round(mean or 0.0, 4),
         }
 
+    def skill_counts(self, job_id: str) -> Optional[tuple]:
+        """
+        Return (matched, missing) skill counts for one job.
+
+        Uses SQLite's json_array_length so summary views can show
+        counts without round-tripping the JSON lists through Python.
+        Returns None if the job_id is unknown.
+        """
+        row = self._conn.execute(_SKILL_COUNTS_SQL, (job_id,)).fetchone()
+        return (row[0] or 0, row[1] or 0) if row else None
+
     def job_exists(self, job_id: str) -> bool:
         """Return True if a job_id already exists in the database."""
         return self._conn.execute(
@@ -354,14 +496,39 @@ class JobStore:
     # ------------------------------------------------------------------
 
     def _init_db(self):
-        """Create jobs table if it doesn't exist."""
-        self._conn.execute(CREATE_TABLE_SQL)
+        """Create the jobs table and query indexes if they don't exist.
+
+        get_all filters on match_score/status and orders by score,
+        and get_stats aggregates per status — without indexes both
+        are full table scans that grow linearly with the table.
+        ANALYZE afterwards gives the query planner the stats it needs
+        to actually pick them.
+        """
+        self._conn.executescript(CREATE_TABLE_SQL + """;
+            CREATE INDEX IF NOT EXISTS idx_jobs_score
+                ON jobs(match_score DESC);
+            CREATE INDEX IF NOT EXISTS idx_jobs_status
+                ON jobs(status);
+            CREATE INDEX IF NOT EXISTS idx_jobs_status_score
+                ON jobs(status, match_score DESC);
+            CREATE INDEX IF NOT EXISTS idx_jobs_last_updated
+                ON jobs(last_updated);
+            ANALYZE;
+        """)
         self._conn.commit()
 
     def _row_to_dict(self, row: sqlite3.Row) -> Dict:
-        """Convert sqlite3.Row to plain dict, deserialising JSON lists."""
+        """Convert sqlite3.Row to plain dict, deserialising JSON lists.
+
+        Empty lists ('[]' or NULL, the common case for missing_skills)
+        skip json.loads entirely. Columns that weren't selected (see
+        get_all's columns parameter) are left out of the dict.
+        """
         d = dict(row)
-        d["matched_skills"] = json.loads(d.get("matched_skills") or "[]")
-        d["missing_skills"] = json.loads(d.get("missing_skills") or "[]")
-        d["status_label"]   = STATUS_LABELS.get(d["status"], d["status"])
+        for key in ("matched_skills", "missing_skills"):
+            if key in d:
+                raw    = d[key]
+                d[key] = json.loads(raw) if raw and raw != "[]" else []
+        if "status" in d:
+            d["status_label"] = STATUS_LABELS.get(d["status"], d["status"])
         return d
@@ -15,6 +15,13 @@ import re
 import logging
 from typing import List
 
+# lxml strips tags in C — worth it for large scraped HTML
+# descriptions; the regex fallback covers everything else
+try:
+    import lxml.html as _lxml_html
+except ImportError:
+    _lxml_html = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,27 +40,34 @@ class JobTextNormalizer:
         clean_text = normalizer.normalize(raw_jd_text)
     """
 
-    # Bullet point variants to standardize
-    BULLET_PATTERNS = [
-        r"^[\•\●\◆\▪\■\○\◦\‣\⁃\-\*]\s+",   # symbol bullets
-        r"^\d+[\.\)]\s+",                      # numbered lists: 1. or 1)
-    ]
+    # Bullet point variants to standardize — symbol bullets and
+    # numbered lists (1. or 1)) fused into one compiled pattern
+    BULLET_PATTERN = re.compile(r"^(?:[\•\●\◆\▪\■\○\◦\‣\⁃\-\*]|\d+[\.\)])\s+")
 
     # HTML tag pattern
     HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
 
-    # Multiple whitespace/newlines
-    MULTI_SPACE_PATTERN   = re.compile(r"[ \t]+")
-    MULTI_NEWLINE_PATTERN = re.compile(r"\n{3,}")
-
-    # Unicode dashes/quotes to normalize
-    UNICODE_REPLACEMENTS = [
-        (r"[\u2013\u2014\u2015]", "-"),   # em/en dashes → hyphen
-        (r"[\u2018\u2019]",       "'"),   # curly single quotes → straight
-        (r"[\u201c\u201d]",       '"'),   # curly double quotes → straight
-        (r"[\u00a0]",             " "),   # non-breaking space → regular space
-        (r"[\u2022\u2023\u25e6]", "-"),   # bullet variants → hyphen
-    ]
+    # Common HTML entities, matched in one alternation pass
+    HTML_ENTITY_PATTERN = re.compile(r"&(amp|lt|gt|nbsp|quot|#39);")
+    HTML_ENTITY_MAP = {
+        "amp": "&", "lt": "<", "gt": ">",
+        "nbsp": " ", "quot": '"', "#39": "'",
+    }
+
+    # Multiple spaces/tabs (blank-run collapse happens per line
+    # in _normalize_lines)
+    MULTI_SPACE_PATTERN = re.compile(r"[ \t]+")
+
+    # Unicode dashes/quotes to normalize. Every replacement is one
+    # char → one char, so a single str.translate pass (C level)
+    # replaces what used to be five full re.sub scans of the text
+    UNICODE_TRANSLATION = str.maketrans({
+        0x2013: "-", 0x2014: "-", 0x2015: "-",  # em/en dashes → hyphen
+        0x2018: "'", 0x2019: "'",               # curly single quotes → straight
+        0x201C: '"', 0x201D: '"',               # curly double quotes → straight
+        0x00A0: " ",                            # non-breaking space → regular
+        0x2022: "-", 0x2023: "-", 0x25E6: "-",  # bullet variants → hyphen
+    })
 
     def normalize(self, text: str) -> str:
         """
@@ -62,10 +76,10 @@ class JobTextNormalizer:
         Steps:
           1. Remove HTML tags
           2. Normalize unicode characters
-          3. Standardize bullet points
-          4. Normalize whitespace
-          5. Remove duplicate lines
-          6. Final strip
+          3. Collapse runs of spaces/tabs
+          4. Per-line pass: standardize bullets, collapse blank runs,
+             drop consecutive duplicate lines
+          5. Final strip
 
         Args:
             text: Raw job description text
@@ -84,9 +98,8 @@ class JobTextNormalizer:
 
         text = self._remove_html(text)
         text = self._normalize_unicode(text)
-        text = self._normalize_bullets(text)
-        text = self._normalize_whitespace(text)
-        text = self._deduplicate_lines(text)
+        text = self.MULTI_SPACE_PATTERN.sub(" ", text)
+        text = self._normalize_lines(text)
 
         return text.strip()
 
@@ -94,59 +107,61 @@ class JobTextNormalizer:
     # PRIVATE HELPERS
     # ------------------------------------------------------------------
 
+    # Below this size the regex wins; above it lxml's C parser does
+    _LXML_MIN_LEN = 1024
+
     def _remove_html(self, text: str) -> str:
-        """Remove HTML tags and decode common HTML entities."""
-        text = self.HTML_TAG_PATTERN.sub(" ", text)
-        # Common HTML entities
-        html_entities = [
-            ("&amp;",  "&"),
-            ("&lt;",   "<"),
-            ("&gt;",   ">"),
-            ("&nbsp;", " "),
-            ("&quot;", '"'),
-            ("&#39;",  "'"),
-        ]
-        for entity, replacement in html_entities:
-            text = text.replace(entity, replacement)
-        return text
+        """Remove HTML tags and decode common HTML entities.
+
+        Most JDs are pasted plain text, so a cheap marker probe skips
+        the whole step when there is nothing to strip. Large scraped
+        pages go through lxml's C parser when it is installed.
+        """
+        if "<" not in text and "&" not in text:
+            return text
+
+        if (
+            _lxml_html is not None
+            and "<" in text
+            and len(text) > self._LXML_MIN_LEN
+        ):
+            try:
+                text = _lxml_html.fromstring(text).text_content()
+            except Exception:
+                text = self.HTML_TAG_PATTERN.sub(" ", text)
+        else:
+            text = self.HTML_TAG_PATTERN.sub(" ", text)
+
+        # One alternation pass instead of six str.replace scans
+        return self.HTML_ENTITY_PATTERN.sub(
+            lambda m: self.HTML_ENTITY_MAP[m.group(1)], text
+        )
 
     def _normalize_unicode(self, text: str) -> str:
         """Replace unicode variants with ASCII equivalents."""
-        for pattern, replacement in self.UNICODE_REPLACEMENTS:
-            text = re.sub(pattern, replacement, text)
-        return text
-
-    def _normalize_bullets(self, text: str) -> str:
-        """Standardize all bullet point styles to '- '."""
-        lines = text.split("\n")
-        normalized = []
-        for line in lines:
-            stripped = line.strip()
-            for pattern in self.BULLET_PATTERNS:
-                if re.match(pattern, stripped):
-                    stripped = re.sub(pattern, "- ", stripped)
-                    break
-            normalized.append(stripped)
-        return "\n".join(normalized)
-
-    def _normalize_whitespace(self, text: str) -> str:
-        """Collapse multiple spaces/tabs and excessive newlines."""
-        text = self.MULTI_SPACE_PATTERN.sub(" ", text)
-        text = self.MULTI_NEWLINE_PATTERN.sub("\n\n", text)
-        return text
+        return text.translate(self.UNICODE_TRANSLATION)
 
-    def _deduplicate_lines(self, text: str) -> str:
+    def _normalize_lines(self, text: str) -> str:
         """
-        Remove consecutive duplicate lines (e.g. repeated section headers).
-        Preserves blank lines as section separators.
+        Bullet standardization, blank-run collapse and consecutive
+        duplicate removal in a single pass over the lines.
+
+        These used to be three separate split/join cycles, each
+        materializing a full line list; one loop halves the peak
+        allocations on large JDs. Single blank lines survive as
+        section separators, and duplicate detection looks across
+        blanks so repeated section headers still collapse.
         """
-        lines = text.split("\n")
-        deduped: List[str] = []
+        out: List[str] = []
         prev = None
-        for line in lines:
-            stripped = line.strip()
-            # Always keep blank lines and non-duplicate lines
-            if stripped == "" or stripped != prev:
-                deduped.append(line)
-            prev = stripped if stripped else prev
-        return "\n".join(deduped)
+        for line in text.splitlines():
+            stripped = self.BULLET_PATTERN.sub("- ", line.strip())
+            if stripped == "":
+                # Collapse blank runs to one separator line
+                if out and out[-1] != "":
+                    out.append("")
+                continue
+            if stripped != prev:
+                out.append(stripped)
+            prev = stripped
+        return "\n".join(out)
@@ -6,16 +6,34 @@ Stores all scores, diagnostics, and metadata produced by
 MatchingEngine.match(resume_profile, job_profile).
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Dict
 
+# Label band boundaries for get_match_label: a score lands in the
+# band left of the first threshold above it
+_LABEL_THRESHOLDS = (0.35, 0.50, 0.65, 0.80)
+_LABELS = (
+    "Poor Match",
+    "Weak Match",
+    "Partial Match",
+    "Good Match",
+    "Excellent Match",
+)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class MatchResult:
     """
     Complete result of matching a resume against a job description.
 
+    Immutable: a result is a snapshot of one match computation, so
+    frozen=True blocks accidental score edits after the fact, and
+    slots=True drops the per-instance __dict__ — matching sessions
+    create one of these per ranked job. Use dataclasses.replace()
+    to derive a variant with different fields.
+
     Scores (all 0.0 → 1.0):
         overall_score:    Final weighted score combining all sub-scores
         semantic_score:   Cosine similarity of resume ↔ job embeddings
@@ -95,20 +113,13 @@ class MatchResult:
             String label for the match quality
 
         Example:
-            >>> result.overall_score = 0.82
+            >>> result = MatchResult(overall_score=0.82)
             >>> result.get_match_label()
             'Excellent Match'
         """
-        if self.overall_score >= 0.80:
-            return "Excellent Match"
-        elif self.overall_score >= 0.65:
-            return "Good Match"
-        elif self.overall_score >= 0.50:
-            return "Partial Match"
-        elif self.overall_score >= 0.35:
-            return "Weak Match"
-        else:
-            return "Poor Match"
+        # Branchless table lookup — summary() calls this in tight
+        # rendering loops over many results
+        return _LABELS[bisect_right(_LABEL_THRESHOLDS, self.overall_score)]
 
     def get_skills_coverage(self) -> float:
         """
@@ -118,8 +129,10 @@ class MatchResult:
             Float 0.0 → 1.0 representing skills coverage
 
         Example:
-            >>> result.matched_skills = ["python", "sql"]
-            >>> result.missing_skills = ["kubernetes"]
+            >>> result = MatchResult(
+            ...     matched_skills=["python", "sql"],
+            ...     missing_skills=["kubernetes"],
+            ... )
             >>> result.get_skills_coverage()
             0.667   # 2 out of 3 required skills
         """
@@ -112,6 +112,11 @@ class PipelineConfig:
     # ------------------------------------------------------------------
     db_path: str = "data/jobs.db"
 
+    # ------------------------------------------------------------------
+    # DATABASE
+    # ------------------------------------------------------------------
+    db_tune: bool = True                  # SQLite PRAGMA tuning (--no-db-tune)
+
     # ------------------------------------------------------------------
     # VALIDATION
     # ------------------------------------------------------------------
@@ -214,4 +219,5 @@ class PipelineConfig:
             "weights":         self.weights,
             "resume_path":     self.resume_path,
             "db_path":         self.db_path,
+            "db_tune":         self.db_tune,
         }
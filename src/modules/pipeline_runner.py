@@ -111,7 +111,7 @@ class PipelineRunner:
             config: PipelineConfig with all search + matching settings
         """
         self.config  = config
-        self.store   = JobStore(config.db_path)
+        self.store   = JobStore(config.db_path, tune=config.db_tune)
         self._matcher = MatchingEngine()
         self._ranker  = RankingEngine(self._matcher)
         self._scraper = PipelineJobScraper(config)
@@ -294,7 +294,8 @@ class PipelineRunner:
         Save qualified ranked jobs to JobStore.
 
         Matches each RankingResult back to its ScrapedJob by job_id,
-        then calls store.save_job().
+        then saves the whole batch in one store.save_jobs() call —
+        one transaction/fsync instead of one per job.
 
         Returns:
             (jobs_new, jobs_saved) counts
@@ -302,9 +303,7 @@ class PipelineRunner:
         # Build a lookup: job_id → ScrapedJob
         scraped_map = {s.job_id: s for s in scraped}
 
-        jobs_new   = 0
-        jobs_saved = 0
-
+        pairs = []
         for result in qualified:
             scraped_job = scraped_map.get(result.job_id)
             if scraped_job is None:
@@ -312,18 +311,15 @@ class PipelineRunner:
                     f"No ScrapedJob found for job_id: {result.job_id}"
                 )
                 continue
+            pairs.append((scraped_job, result))
 
-            already_exists = self.store.job_exists(scraped_job.job_id)
-
-            try:
-                inserted = self.store.save_job(scraped_job, result)
-                jobs_saved += 1
-                if inserted:
-                    jobs_new += 1
-            except Exception as e:
-                logger.warning(
-                    f"Failed to save {scraped_job.raw_title}: {e}"
-                )
+        jobs_new   = 0
+        jobs_saved = 0
+        try:
+            jobs_new   = self.store.save_jobs(pairs)
+            jobs_saved = len(pairs)
+        except Exception as e:
+            logger.warning(f"Batch save failed: {e}")
 
         logger.info(
             f"Saved {jobs_saved} jobs "
@@ -67,6 +67,44 @@ class SkillsExtractor:
         if not text or not text.strip():
             return [], []
 
+        doc = self._nlp(text) if self.use_nlp else None
+        return self._extract_from_doc(text, doc)
+
+    def extract_skills_batch(self, texts: List[str]) -> List[Tuple[List[str], List[str]]]:
+        """
+        Extract skills from several texts in one spaCy pipe call.
+
+        nlp.pipe() batches tokenization and the model's pipeline
+        components across all inputs, amortizing the fixed per-call
+        overhead that N separate extract_skills() calls would each
+        pay. Empty texts keep their slot but skip the pipeline.
+
+        Args:
+            texts: Cleaned text sections (order is preserved).
+
+        Returns:
+            List of (hard_skills, soft_skills) tuples, one per input.
+        """
+        results: List[Tuple[List[str], List[str]]] = [([], [])] * len(texts)
+        pending = [i for i, t in enumerate(texts) if t and t.strip()]
+
+        if self.use_nlp and pending:
+            docs = self._nlp.pipe((texts[i] for i in pending), batch_size=32)
+            for i, doc in zip(pending, docs):
+                results[i] = self._extract_from_doc(texts[i], doc)
+        else:
+            for i in pending:
+                results[i] = self._extract_from_doc(texts[i], None)
+
+        return results
+
+    def _extract_from_doc(self, text: str, doc) -> Tuple[List[str], List[str]]:
+        """
+        Shared per-text extraction given an (optional) parsed doc.
+
+        Steps 1-3 of extract_skills(): taxonomy matching, spaCy
+        enhancement when a doc is provided, then cleanup and sorting.
+        """
         # Step 1: Taxonomy-based extraction
         hard_tax, soft_tax = self.taxonomy.extract_skills_from_text(text)
 
@@ -74,9 +112,7 @@ class SkillsExtractor:
         soft_set: Set[str] = set(soft_tax)
 
         # Step 2: Optional spaCy-based enhancement
-        if self.use_nlp:
-            doc = self._nlp(text)
-
+        if doc is not None:
             hard_nlp = self._extract_nlp_hard_skills(doc)
             soft_nlp = self._extract_nlp_soft_skills(doc)
 